@@ -0,0 +1,66 @@
+"""Measure parsing throughput on pathological coordinate strings.
+
+Each case grows an adversarial feature of the input (a long name, many hyphens, a
+giant epoch, ...) and reports the time per parse attempt, accepted or rejected. With
+the default `ParseLimits` the time per attempt should stay flat as inputs grow, since
+oversized input is rejected before it is split or converted. Pass `--unlimited` to
+compare against limits large enough to never apply.
+
+    python benchmarks/bench_adversarial.py
+    python benchmarks/bench_adversarial.py --unlimited --sizes 10 1000 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from collections.abc import Callable
+
+from pkgps import NEVRA, MalformedCoordinates, ParseLimits
+
+CASES: dict[str, Callable[[int], str]] = {
+    "baseline": lambda n: "curl-1:7.76.1-26.el9.x86_64",
+    "long name": lambda n: f"{'a' * n}-1:7.76.1-26.el9.x86_64",
+    "many hyphens": lambda n: f"{'-' * n}1:7.76.1-26.el9.x86_64",
+    "many dots": lambda n: f"curl-1:7.76.1-26{'.' * n}x86_64",
+    "many colons": lambda n: f"curl-{':' * n}7.76.1-26.el9.x86_64",
+    "giant epoch": lambda n: f"curl-{'9' * n}:7.76.1-26.el9.x86_64",
+    "no separators": lambda n: "a" * n,
+}
+
+
+UNLIMITED = ParseLimits(
+    length=2**62, name=2**62, epoch=2**62, version=2**62, release=2**62, arch=2**62
+)
+
+
+def time_per_parse(coordinate: str, number: int, limits: ParseLimits) -> float:
+    parse = NEVRA.from_string
+    start = time.perf_counter()
+    for _ in range(number):
+        try:
+            parse(coordinate, limits=limits)
+        except (MalformedCoordinates, ValueError):
+            # without limits Python may refuse to convert a giant epoch itself
+            pass
+    return (time.perf_counter() - start) / number
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[10, 1_000, 100_000, 10_000_000]
+    )
+    parser.add_argument("--number", type=int, default=200)
+    parser.add_argument("--unlimited", action="store_true")
+    args = parser.parse_args()
+    limits = UNLIMITED if args.unlimited else ParseLimits()
+
+    print(f"{'case':<14}" + "".join(f"{size:>14,}" for size in args.sizes))
+    for name, make in CASES.items():
+        row = [time_per_parse(make(size), args.number, limits) for size in args.sizes]
+        print(f"{name:<14}" + "".join(f"{t * 1e6:>12.2f}us" for t in row))
+
+
+if __name__ == "__main__":
+    main()
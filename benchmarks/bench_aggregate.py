@@ -0,0 +1,75 @@
+"""Measure how fleet aggregation scales with the number of worker processes.
+
+Generates a synthetic fleet of manifests in a temporary directory and aggregates them
+with increasing numbers of workers, e.g.
+
+    python benchmarks/bench_aggregate.py --hosts 2000 --packages 1500
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from pkgps.aggregate import aggregate_manifests, find_lagging_hosts
+
+
+def write_fleet(directory: Path, hosts: int, packages: int) -> list[Path]:
+    arches = ("x86_64", "noarch", "i686")
+    paths = []
+    for host in range(hosts):
+        lines = [
+            f"package-{p}-{p % 5}.{(p + host) % 3}.0-{host % 4 + 1}.el9"
+            f".{arches[p % len(arches)]}\n"
+            for p in range(packages)
+        ]
+        path = directory / f"host-{host:06d}.txt"
+        path.write_text("".join(lines), encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--hosts", type=int, default=1000)
+    parser.add_argument("--packages", type=int, default=1000)
+    parser.add_argument("--chunksize", type=int, default=64)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        paths = write_fleet(Path(directory), args.hosts, args.packages)
+        lines = args.hosts * args.packages
+        baseline = None
+        for workers in args.workers:
+            start = time.perf_counter()
+            fleet = aggregate_manifests(
+                paths, max_workers=workers, chunksize=args.chunksize
+            )
+            aggregated = time.perf_counter() - start
+            lagging = sum(
+                1
+                for _ in find_lagging_hosts(
+                    paths, fleet, max_workers=workers, chunksize=args.chunksize
+                )
+            )
+            total = time.perf_counter() - start
+            rate = lines / aggregated
+            baseline = baseline or rate
+            print(
+                f"workers={workers:<3} aggregate {rate:>12,.0f} lines/s  "
+                f"speedup={rate / baseline:.2f}x  "
+                f"lagging={lagging:,} in {total - aggregated:.2f}s"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Measure parsing and sorting throughput of Debian coordinates.
+
+Sorting uses each instance's cached `version_key`, so versions are tokenized once per
+instance rather than once per comparison. The comparison-function baseline re-tokenizes
+both versions on every comparison, the way a `cmp_to_key` sort over dpkg's
+`verrevcmp` would.
+
+    python benchmarks/bench_deb.py --size 300000
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from functools import cmp_to_key
+
+from pkgps import NVR, Deb
+from pkgps.deb import _dpkg_key
+
+
+def corpus(size: int, seed: int) -> list[str]:
+    rng = random.Random(seed)  # nosec B311
+    suffixes = ("", "~rc1", "+dfsg", "a", ".1")
+    lines = []
+    for _ in range(size):
+        epoch = f"{rng.randrange(3)}:" if rng.random() < 0.1 else ""
+        upstream = f"{rng.randrange(10)}.{rng.randrange(40)}{rng.choice(suffixes)}"
+        revision = f"{rng.randrange(12)}+deb12u{rng.randrange(6)}"
+        lines.append(f"pkg{rng.randrange(30000)}_{epoch}{upstream}-{revision}")
+    return lines
+
+
+def _compare(a: Deb, b: Deb) -> int:
+    key_a = (
+        a.name,
+        a.epoch,
+        *_dpkg_key(a.upstream_version),
+        *_dpkg_key(a.debian_revision),
+    )
+    key_b = (
+        b.name,
+        b.epoch,
+        *_dpkg_key(b.upstream_version),
+        *_dpkg_key(b.debian_revision),
+    )
+    return (key_a > key_b) - (key_a < key_b)
+
+
+def timed(label: str, size: int, func) -> object:
+    start = time.perf_counter()
+    result = func()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {size / elapsed:>12,.0f} items/s")
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=300_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    lines = corpus(args.size, args.seed)
+    nvrs = [line.replace("_", "-", 1).replace(":", ".") for line in lines]
+    timed("NVR.from_string", args.size, lambda: [NVR.from_string(n) for n in nvrs])
+    debs = timed(
+        "Deb.from_string", args.size, lambda: [Deb.from_string(d) for d in lines]
+    )
+    timed(
+        "sort, comparison function",
+        args.size,
+        lambda: sorted(debs, key=cmp_to_key(_compare)),
+    )
+    timed("sort, cached key (cold)", args.size, lambda: sorted(debs))
+    timed("sort, cached key (warm)", args.size, lambda: sorted(debs))
+
+
+if __name__ == "__main__":
+    main()
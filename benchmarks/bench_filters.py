@@ -0,0 +1,56 @@
+"""Compare a `BloomFilter` with a `set` of coordinates for size and lookup speed.
+
+python benchmarks/bench_filters.py --size 1000000 --fp-rate 0.001
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pkgps import NEVRA, BloomFilter
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--fp-rate", type=float, default=0.001)
+    args = parser.parse_args()
+
+    members = [
+        f"pkg{i % 30000}-{i % 3}:1.{i}-{i % 7}.el9.x86_64" for i in range(args.size)
+    ]
+    probes = [f"other{i}-1:2.{i}-1.el9.aarch64" for i in range(args.size // 10)]
+
+    gc.collect()
+    tracemalloc.start()
+    coordinates = {NEVRA.from_string(m) for m in members}
+    set_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    bloom = BloomFilter.from_coordinates(members, fp_rate=args.fp_rate)
+    serialized = bloom.to_bytes()
+
+    parsed_probes = [NEVRA.from_string(p) for p in probes]
+    start = time.perf_counter()
+    hits = sum(p in coordinates for p in parsed_probes)
+    set_rate = len(probes) / (time.perf_counter() - start)
+    start = time.perf_counter()
+    false_positives = sum(bloom.contains_many(probes))
+    bloom_rate = len(probes) / (time.perf_counter() - start)
+
+    print(f"members:            {args.size:,}")
+    print(
+        f"set of NEVRA:       {set_bytes / 2**20:10.1f} MiB  {set_rate:>12,.0f} lookups/s"
+    )
+    print(
+        f"BloomFilter:        {len(serialized) / 2**20:10.1f} MiB  "
+        f"{bloom_rate:>12,.0f} lookups/s"
+    )
+    print(f"false positives:    {false_positives / len(probes):.4%} (set: {hits})")
+
+
+if __name__ == "__main__":
+    main()
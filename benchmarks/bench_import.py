@@ -0,0 +1,55 @@
+"""Measure how long `import pkgps` takes in a fresh interpreter.
+
+Each sample starts a new interpreter so nothing is cached in `sys.modules`. The
+interpreter's own startup time is measured separately and subtracted.
+
+    python benchmarks/bench_import.py
+    python benchmarks/bench_import.py --module pkgps.extensions.pydantic --max-ms 20
+
+With `--max-ms` the script exits non-zero when the median import time exceeds the
+budget, so it can guard against startup regressions in CI.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def sample(code: str, runs: int) -> float:
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], check=True, env=env)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--module", default="pkgps")
+    parser.add_argument("--runs", type=int, default=30)
+    parser.add_argument("--max-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    baseline = sample("pass", args.runs)
+    with_import = sample(f"import {args.module}", args.runs)
+    cost = with_import - baseline
+    print(f"interpreter startup: {baseline:8.2f} ms")
+    print(f"import {args.module}: {cost:8.2f} ms")
+    if args.max_ms is not None and cost > args.max_ms:
+        print(f"import time exceeds budget of {args.max_ms} ms", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""Measure the memory saved by interning components of parsed coordinates.
+
+Builds a corpus shaped like a fleet inventory (many hosts sharing a limited set of
+names, versions, releases, and arches), parses it with and without an `Interner`,
+and reports the memory held by the parsed coordinates as measured by `tracemalloc`.
+
+    python benchmarks/bench_interning.py --size 1000000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import random
+import tracemalloc
+
+from pkgps import NEVRA, Interner
+
+ARCHES = ("x86_64", "aarch64", "noarch", "ppc64le", "s390x", "i686")
+
+
+def corpus(size: int, names: int, seed: int) -> list[str]:
+    rng = random.Random(seed)  # nosec B311
+    lines = []
+    for _ in range(size):
+        n = rng.randrange(names)
+        lines.append(
+            f"package{n}-{n % 3}:{n % 50}.{rng.randrange(4)}-{rng.randrange(8)}.el9"
+            f".{ARCHES[n % len(ARCHES)]}"
+        )
+    return lines
+
+
+def measure(lines: list[str], interner: Interner | None) -> int:
+    gc.collect()
+    tracemalloc.start()
+    parse = NEVRA.from_string
+    parsed = [parse(line, interner=interner) for line in lines]
+    if interner is not None:
+        # the pools belong to the interner, not to the coordinates
+        interner.clear()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del parsed
+    return current
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=1_000_000)
+    parser.add_argument("--names", type=int, default=30_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    lines = corpus(args.size, args.names, args.seed)
+    plain = measure(lines, None)
+    interned = measure(lines, Interner())
+    print(f"coordinates:  {args.size:,} ({args.names:,} distinct names)")
+    print(f"plain:        {plain / 2**20:10.1f} MiB")
+    print(f"interned:     {interned / 2**20:10.1f} MiB")
+    print(f"reduction:    {1 - interned / plain:10.1%}")
+
+
+if __name__ == "__main__":
+    main()
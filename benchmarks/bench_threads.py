@@ -0,0 +1,72 @@
+"""Measure how coordinate parsing throughput scales with the number of threads.
+
+Run with both a regular and a free-threaded build of CPython to compare, e.g.
+
+    python benchmarks/bench_threads.py
+    python3.13t benchmarks/bench_threads.py
+
+On builds with the GIL throughput stays roughly flat as threads are added. On
+free-threaded builds it should grow close to linearly up to the number of cores.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from pkgps import NEVRA
+from pkgps.parallel import parse_many
+
+
+def corpus(size: int) -> list[str]:
+    arches = ("x86_64", "aarch64", "noarch", "ppc64le", "s390x")
+    return [
+        f"package-{i % 30000}-{i % 3}:{i % 17}.{i % 101}.{i % 7}-{i % 13}.el9"
+        f".{arches[i % len(arches)]}"
+        for i in range(size)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=500_000)
+    parser.add_argument("--chunksize", type=int, default=4096)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--threads",
+        type=int,
+        nargs="+",
+        default=sorted({1, 2, 4, 8, os.cpu_count() or 1}),
+    )
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"python {sys.version.split()[0]} gil={'on' if gil else 'off'}")
+    coordinates = corpus(args.size)
+    baseline = None
+    for threads in args.threads:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            best = float("inf")
+            for _ in range(args.repeat):
+                start = time.perf_counter()
+                parse_many(
+                    NEVRA,
+                    coordinates,
+                    max_workers=threads,
+                    chunksize=args.chunksize,
+                    executor=executor,
+                )
+                best = min(best, time.perf_counter() - start)
+        rate = args.size / best
+        baseline = baseline or rate
+        print(
+            f"threads={threads:<3} {rate:>12,.0f} coords/s  "
+            f"speedup={rate / baseline:.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,56 @@
-__all__ = ["MalformedCoordinates", "NEVR", "NEVRA", "NVR", "NVRA"]
+__all__ = [
+    "BloomFilter",
+    "Deb",
+    "Interner",
+    "MalformedCoordinates",
+    "NEVR",
+    "NEVRA",
+    "NVR",
+    "NVRA",
+    "ParseLimits",
+]
+
+import importlib
+
+# `typing.TYPE_CHECKING` would cost an import of `typing` on startup; type checkers
+# treat any name `TYPE_CHECKING` as true.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from ._exceptions import MalformedCoordinates
+    from .deb import Deb
+    from .filters import BloomFilter
+    from .interning import Interner
+    from .nvr import NEVR, NEVRA, NVR, NVRA, ParseLimits
+
+# Public names are imported on first access (PEP 562) so that `import pkgps` stays
+# cheap for short-lived processes which may never touch most of the API.
+_LAZY_ATTRIBUTES = {
+    "BloomFilter": ".filters",
+    "Deb": ".deb",
+    "Interner": ".interning",
+    "MalformedCoordinates": "._exceptions",
+    "NEVR": ".nvr",
+    "NEVRA": ".nvr",
+    "NVR": ".nvr",
+    "NVRA": ".nvr",
+    "ParseLimits": ".nvr",
+}
+
+
+def __getattr__(name: str) -> object:
+    try:
+        module = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module, __name__), name)
+    # cache on the module so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
 
-from ._exceptions import MalformedCoordinates
-from .nvr import NEVR, NEVRA, NVR, NVRA
 
 try:
     from .version import __version__
@@ -0,0 +1,320 @@
+"""Aggregate package inventories across a fleet of hosts.
+
+Each host contributes a manifest: a text file listing the `NEVRA` coordinates of its
+installed packages, one per line, like the output of `rpm -qa`. `aggregate_manifests`
+parses manifests on a pool of worker processes, reduces each host to per-package
+counters, and merges the counters from every worker in to a single `FleetAggregate`.
+
+Memory use is bounded by the number of distinct packages and versions in the fleet,
+not by the number of hosts: a `FleetAggregate` only ever holds counts, and only a
+couple of partial aggregates per worker exist at any time.
+
+```python
+fleet = aggregate_manifests(Path("manifests").glob("*.txt"))
+for report in fleet.reports():
+    print(report.name, report.arch, report.newest, report.lagging)
+```
+
+Finding which hosts lag behind needs a second pass over the manifests, see
+`find_lagging_hosts`.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "FleetAggregate",
+    "LaggingHost",
+    "PackageReport",
+    "aggregate_manifests",
+    "find_lagging_hosts",
+]
+
+import os
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from itertools import chain, islice
+from os import PathLike
+from pathlib import Path
+from typing import TypeVar
+
+from attr import frozen
+
+from .evr import _evr_key
+from .nvr import NEVRA
+
+_Key = tuple[str, str]
+"""Name and arch."""
+_EVR = tuple[int, str, str]
+"""Epoch, version, and release."""
+
+R = TypeVar("R")
+
+DEFAULT_CHUNKSIZE = 64
+"""The default number of manifests handed to a worker process at a time."""
+
+
+def _newest(evrs: Iterable[_EVR]) -> _EVR:
+    return max(evrs, key=lambda evr: _evr_key(*evr))
+
+
+def _to_nevra(key: _Key, evr: _EVR) -> NEVRA:
+    name, arch = key
+    epoch, version, release = evr
+    return NEVRA(name=name, epoch=epoch, version=version, release=release, arch=arch)
+
+
+def _read_manifest(path: str | PathLike[str]) -> Iterator[NEVRA]:
+    with Path(path).open(encoding="utf-8") as manifest:
+        for raw in manifest:
+            line = raw.strip()
+            if line:
+                yield NEVRA.from_string(line)
+
+
+@frozen(kw_only=True)
+class PackageReport:
+    """The versions of one package running across the fleet."""
+
+    name: str
+    """Name."""
+    arch: str
+    """Architecture."""
+    hosts: int
+    """The number of hosts running any version of the package."""
+    versions: tuple[tuple[NEVRA, int], ...]
+    """Each version running in the fleet and how many hosts run it, newest first."""
+
+    @property
+    def newest(self) -> NEVRA:
+        """The newest version running anywhere in the fleet."""
+        return self.versions[0][0]
+
+    @property
+    def current(self) -> int:
+        """The number of hosts running the newest version."""
+        return self.versions[0][1]
+
+    @property
+    def lagging(self) -> int:
+        """The number of hosts running the package but not its newest version."""
+        return self.hosts - self.current
+
+
+@frozen(kw_only=True)
+class LaggingHost:
+    """A host running an older version of a package than the newest in the fleet."""
+
+    host: str
+    """The manifest the package was found in."""
+    installed: NEVRA
+    """The newest version installed on the host."""
+    newest: NEVRA
+    """The newest version of the package running in the fleet."""
+
+
+class FleetAggregate:
+    """Counts of hosts running each version of each package, keyed by name and arch.
+
+    Aggregates built from disjoint sets of hosts can be combined with `merge`.
+    """
+
+    def __init__(self) -> None:
+        self.hosts = 0
+        """The number of hosts aggregated."""
+        self._versions: dict[_Key, Counter[_EVR]] = {}
+        self._hosts_with: Counter[_Key] = Counter()
+
+    def add_host(self, coordinates: Iterable[NEVRA]) -> None:
+        """Count the packages installed on one host.
+
+        A host may run several versions of the same package e.g. kernels. Each version
+        is counted once for the host, and the host is counted once for the package.
+        """
+        installed = {
+            (c.name, c.arch, (c.epoch, c.version, c.release)) for c in coordinates
+        }
+        versions = self._versions
+        for name, arch, evr in installed:
+            key = (name, arch)
+            counter = versions.get(key)
+            if counter is None:
+                counter = versions[key] = Counter()
+            counter[evr] += 1
+        self._hosts_with.update({(name, arch) for name, arch, _ in installed})
+        self.hosts += 1
+
+    def add_manifest(self, path: str | PathLike[str]) -> None:
+        """Parse the manifest at `path` and count it as one host."""
+        self.add_host(_read_manifest(path))
+
+    def merge(self, other: FleetAggregate) -> FleetAggregate:
+        """Add the counts from `other` to this aggregate and return it."""
+        versions = self._versions
+        for key, counter in other._versions.items():
+            mine = versions.get(key)
+            if mine is None:
+                versions[key] = Counter(counter)
+            else:
+                mine.update(counter)
+        self._hosts_with.update(other._hosts_with)
+        self.hosts += other.hosts
+        return self
+
+    def newest(self) -> dict[_Key, NEVRA]:
+        """The newest version of each package running anywhere in the fleet."""
+        return {
+            key: _to_nevra(key, _newest(counter))
+            for key, counter in self._versions.items()
+        }
+
+    def reports(self) -> Iterator[PackageReport]:
+        """Yield a report per package, ordered by name and arch."""
+        for key in sorted(self._versions):
+            counter = self._versions[key]
+            ordered = sorted(counter, key=lambda evr: _evr_key(*evr), reverse=True)
+            yield PackageReport(
+                name=key[0],
+                arch=key[1],
+                hosts=self._hosts_with[key],
+                versions=tuple((_to_nevra(key, evr), counter[evr]) for evr in ordered),
+            )
+
+
+def _aggregate_chunk(paths: list[str | PathLike[str]]) -> FleetAggregate:
+    aggregate = FleetAggregate()
+    for path in paths:
+        aggregate.add_manifest(path)
+    return aggregate
+
+
+def _lagging_in_chunk(
+    paths: list[str | PathLike[str]], newest: dict[_Key, _EVR]
+) -> list[LaggingHost]:
+    lagging = []
+    for path in paths:
+        installed: dict[_Key, list[_EVR]] = {}
+        for c in _read_manifest(path):
+            installed.setdefault((c.name, c.arch), []).append(
+                (c.epoch, c.version, c.release)
+            )
+        host = str(path)
+        for key, evrs in installed.items():
+            evr = newest.get(key)
+            # a host running the newest version alongside older ones (e.g. kernels)
+            # isn't lagging behind
+            if evr is None or evr in evrs:
+                continue
+            lagging.append(
+                LaggingHost(
+                    host=host,
+                    installed=_to_nevra(key, _newest(evrs)),
+                    newest=_to_nevra(key, evr),
+                )
+            )
+    return lagging
+
+
+# Arguments shared by every chunk a worker process handles, set once per process by
+# the pool's initializer rather than pickled again with every chunk.
+_shared: tuple[object, ...] = ()
+
+
+def _share(shared: tuple[object, ...]) -> None:
+    global _shared
+    _shared = shared
+
+
+def _apply_shared(func: Callable[..., R], chunk: list[str | PathLike[str]]) -> R:
+    return func(chunk, *_shared)
+
+
+def _map_chunks(
+    func: Callable[..., R],
+    paths: Iterable[str | PathLike[str]],
+    max_workers: int | None,
+    chunksize: int,
+    shared: tuple[object, ...] = (),
+) -> Iterator[R]:
+    """Apply `func` to chunks of `paths`, in worker processes unless `max_workers` is 1.
+
+    `func` is called with each chunk followed by `shared`. Results are yielded as they
+    complete, not in input order. Only a couple of chunks per worker are in flight at
+    a time, and each result is released as soon as it is yielded, so memory held here
+    doesn't grow with the number of chunks.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    items = iter(paths)
+    chunks = iter(lambda: list(islice(items, chunksize)), [])
+    head = list(islice(chunks, 2))
+    if max_workers == 1 or len(head) <= 1:
+        for chunk in chain(head, chunks):
+            yield func(chunk, *shared)
+        return
+    in_flight = 2 * (max_workers or os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=_share, initargs=(shared,)
+    ) as executor:
+        pending: set[Future[R]] = set()
+        for chunk in chain(head, chunks):
+            if len(pending) >= in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                while done:
+                    yield done.pop().result()
+            pending.add(executor.submit(_apply_shared, func, chunk))
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            while done:
+                yield done.pop().result()
+
+
+def aggregate_manifests(
+    paths: Iterable[str | PathLike[str]],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> FleetAggregate:
+    """Parse and aggregate the manifests at `paths`, one manifest per host.
+
+    Args:
+        paths: The manifests to aggregate.
+        max_workers: The number of worker processes. Defaults to the number of CPUs.
+            Pass 1 to aggregate in the calling process.
+        chunksize: How many manifests each worker aggregates at a time. Partial
+            aggregates are merged as soon as they are ready.
+
+    Raises:
+        MalformedCoordinates: If any line of any manifest can't be parsed.
+    """
+    fleet = FleetAggregate()
+    for partial in _map_chunks(_aggregate_chunk, paths, max_workers, chunksize):
+        fleet.merge(partial)
+    return fleet
+
+
+def find_lagging_hosts(
+    paths: Iterable[str | PathLike[str]],
+    aggregate: FleetAggregate,
+    *,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+) -> Iterator[LaggingHost]:
+    """Yield every package on every host that is older than the newest in `aggregate`.
+
+    Hosts are identified by the path of their manifest. Results are yielded a chunk
+    of manifests at a time as chunks complete, so they are grouped by host but
+    otherwise unordered.
+
+    Args:
+        paths: The manifests to check, usually the ones `aggregate` was built from.
+        aggregate: The aggregate to compare against.
+        max_workers: The number of worker processes. Defaults to the number of CPUs.
+            Pass 1 to check in the calling process.
+        chunksize: How many manifests each worker checks at a time.
+    """
+    newest = {key: _newest(counter) for key, counter in aggregate._versions.items()}
+    for lagging in _map_chunks(
+        _lagging_in_chunk, paths, max_workers, chunksize, (newest,)
+    ):
+        yield from lagging
@@ -0,0 +1,398 @@
+"""The `pkgps` command: normalize, convert, sort, dedupe, and filter coordinates.
+
+Reads coordinates one per line from files or stdin and writes them in canonical form
+to stdout, e.g.
+
+```shell
+rpm -qa | pkgps --to NVRA --arch x86_64 --arch noarch --sort --unique
+```
+
+Input is read and parsed in blocks of lines rather than line by line, and each block
+is parsed on a pool of threads with `parse_many`. Threads only pay off on free-threaded
+builds of CPython, so on builds with the GIL blocks are parsed on the main thread
+unless `--workers` says otherwise.
+
+Output is written a block at a time unless `--sort` is given, which has to hold every
+coordinate until the input ends. `--unique` holds one copy of each distinct
+coordinate seen so far.
+"""
+
+from __future__ import annotations
+
+__all__ = ["main"]
+
+import argparse
+import os
+import sys
+import time
+from collections.abc import Callable, Iterable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from itertools import islice
+from pathlib import Path
+from typing import Any, TextIO
+
+from ._exceptions import MalformedCoordinates
+from .evr import version_key
+from .interning import Interner
+from .nvr import NEVR, NEVRA, NVR, NVRA
+from .parallel import DEFAULT_CHUNKSIZE, parse_many
+
+_TYPES: dict[str, type[NVR]] = {"NVR": NVR, "NEVR": NEVR, "NVRA": NVRA, "NEVRA": NEVRA}
+_WITH_ARCH = (NVRA, NEVRA)
+_WITH_EPOCH = (NEVR, NEVRA)
+
+BLOCKSIZE = 65_536
+"""The default number of lines read and parsed at a time."""
+
+
+class _UnreadableInput(Exception):
+    """Raised when an input can't be decoded as text."""
+
+
+class _Stats:
+    def __init__(self) -> None:
+        self.read = 0
+        self.invalid = 0
+        self.written = 0
+        self.start = time.perf_counter()
+
+    def report(self, stream: TextIO) -> None:
+        elapsed = time.perf_counter() - self.start
+        rate = self.read / elapsed if elapsed else 0.0
+        stream.write(
+            f"pkgps: read {self.read:,} lines in {elapsed:.3f}s ({rate:,.0f} lines/s), "
+            f"wrote {self.written:,}, {self.invalid:,} invalid\n"
+        )
+
+
+def _parser() -> argparse.ArgumentParser:
+    types = ", ".join(_TYPES)
+    parser = argparse.ArgumentParser(
+        prog="pkgps",
+        description="Normalize, convert, sort, dedupe, and filter package coordinates "
+        "read one per line.",
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        metavar="FILE",
+        help="Files to read. Reads stdin if none are given or for '-'.",
+    )
+    parser.add_argument(
+        "-f",
+        "--from",
+        dest="from_type",
+        type=str.upper,
+        choices=_TYPES,
+        default="NEVRA",
+        metavar="TYPE",
+        help=f"The type of the input coordinates, one of {types}. Epochs are optional "
+        "in NEVR and NEVRA input. Defaults to NEVRA.",
+    )
+    parser.add_argument(
+        "-t",
+        "--to",
+        dest="to_type",
+        type=str.upper,
+        choices=_TYPES,
+        metavar="TYPE",
+        help="The type to convert coordinates to. Converting to a type without an "
+        "epoch drops it. Defaults to the input type.",
+    )
+    parser.add_argument(
+        "-s",
+        "--sort",
+        action="store_true",
+        help="Sort by name, then epoch, version, and release as RPM orders them, "
+        "then arch. Coordinates which sort equal keep their input order.",
+    )
+    parser.add_argument(
+        "-u",
+        "--unique",
+        action="store_true",
+        help="Drop duplicate coordinates, after conversion.",
+    )
+    parser.add_argument(
+        "-n",
+        "--name",
+        dest="names",
+        action="append",
+        metavar="NAME",
+        help="Only keep coordinates with this name. May be repeated.",
+    )
+    parser.add_argument(
+        "-a",
+        "--arch",
+        dest="arches",
+        action="append",
+        metavar="ARCH",
+        help="Only keep coordinates with this arch. May be repeated.",
+    )
+    parser.add_argument(
+        "--skip-invalid",
+        action="store_true",
+        help="Warn about and skip lines which can't be parsed instead of failing.",
+    )
+    parser.add_argument(
+        "-j",
+        "--workers",
+        type=int,
+        metavar="N",
+        help="The number of threads parsing each block. Defaults to 1 on builds of "
+        "Python with the GIL, and the ThreadPoolExecutor default otherwise.",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=DEFAULT_CHUNKSIZE,
+        metavar="N",
+        help=f"How many lines each thread parses at a time. Defaults to "
+        f"{DEFAULT_CHUNKSIZE}.",
+    )
+    parser.add_argument(
+        "--blocksize",
+        type=int,
+        default=BLOCKSIZE,
+        metavar="N",
+        help=f"How many lines are read and parsed at a time. Defaults to {BLOCKSIZE}.",
+    )
+    parser.add_argument(
+        "--stats",
+        action="store_true",
+        help="Report the number of lines processed and throughput to stderr.",
+    )
+    return parser
+
+
+def _default_workers() -> int | None:
+    gil_enabled = getattr(sys, "_is_gil_enabled", lambda: True)()
+    return 1 if gil_enabled else None
+
+
+def _blocks(
+    files: Sequence[str], blocksize: int, stdin: TextIO
+) -> Iterator[tuple[str, int, list[str]]]:
+    """Yield blocks of lines with their file name and the line number they start at."""
+    for name in files or ["-"]:
+        if name == "-":
+            yield from _file_blocks("<stdin>", stdin, blocksize)
+        else:
+            with Path(name).open(encoding="utf-8") as stream:
+                yield from _file_blocks(name, stream, blocksize)
+
+
+def _file_blocks(
+    name: str, stream: TextIO, blocksize: int
+) -> Iterator[tuple[str, int, list[str]]]:
+    lineno = 1
+    try:
+        while block := list(islice(stream, blocksize)):
+            yield name, lineno, block
+            lineno += len(block)
+    except UnicodeDecodeError as ude:
+        raise _UnreadableInput(f"pkgps: {name}: {ude}") from ude
+
+
+def _parse_lines(
+    type_: type[NVR],
+    name: str,
+    lineno: int,
+    lines: list[str],
+    stats: _Stats,
+    skip_invalid: bool,
+    errors: TextIO,
+    interner: Interner | None,
+) -> list[NVR]:
+    """Parse lines one at a time, to find which of them are malformed."""
+    parsed = []
+    for offset, line in enumerate(lines):
+        stripped = line.strip()
+        if not stripped:
+            continue
+        try:
+            parsed.append(type_.from_string(stripped, interner=interner))
+        except MalformedCoordinates as mc:
+            message = f"pkgps: {name}:{lineno + offset}: {mc}"
+            if not skip_invalid:
+                raise MalformedCoordinates(message) from mc
+            errors.write(f"{message}\n")
+            stats.invalid += 1
+    return parsed
+
+
+def _convert(coordinates: Iterable[NVR], type_: type[NVR]) -> Iterator[NVR]:
+    with_epoch, with_arch = type_ in _WITH_EPOCH, type_ in _WITH_ARCH
+    for c in coordinates:
+        fields: dict[str, Any] = {
+            "name": c.name,
+            "version": c.version,
+            "release": c.release,
+        }
+        if with_epoch:
+            fields["epoch"] = getattr(c, "epoch", 0)
+        if with_arch:
+            fields["arch"] = getattr(c, "arch", "")
+        yield type_(**fields)
+
+
+def _first_seen(coordinates: list[NVR], seen: set[NVR]) -> list[NVR]:
+    """Drop coordinates in `seen`, adding the rest to it in input order."""
+    unseen = []
+    for c in coordinates:
+        if c not in seen:
+            seen.add(c)
+            unseen.append(c)
+    return unseen
+
+
+def _sort_key() -> Callable[[NVR], tuple[object, ...]]:
+    """Build a sort key function which orders coordinates the way `evr_key` does.
+
+    Inventories repeat the same versions and releases many times over, so the key for
+    each distinct version and release is built once and kept for the rest of the sort.
+    Neither key can be a prefix of another, so comparing them one after the other
+    orders the same as comparing them concatenated like `evr_key` does.
+    """
+    versions: dict[str, tuple[int | str, ...]] = {}
+    releases: dict[str, tuple[int | str, ...]] = {}
+
+    def key(coordinates: NVR) -> tuple[object, ...]:
+        version, release = coordinates.version, coordinates.release
+        v = versions.get(version)
+        if v is None:
+            v = versions[version] = version_key(version)
+        r = releases.get(release)
+        if r is None:
+            r = releases[release] = version_key(release)
+        return (
+            coordinates.name,
+            getattr(coordinates, "epoch", 0),
+            v,
+            r,
+            getattr(coordinates, "arch", ""),
+        )
+
+    return key
+
+
+def _run(
+    args: argparse.Namespace,
+    from_type: type[NVR],
+    to_type: type[NVR],
+    stdin: TextIO,
+    stdout: TextIO,
+    stderr: TextIO,
+    stats: _Stats,
+) -> None:
+    names = set(args.names) if args.names else None
+    arches = set(args.arches) if args.arches else None
+    seen: set[NVR] = set()
+    kept: list[NVR] = []
+    # the interner makes repeated names, versions, and arches share one string each,
+    # which matters when coordinates are held until the end for --sort or --unique
+    interner = Interner() if args.sort or args.unique else None
+    workers = args.workers or _default_workers()
+    with ExitStack() as stack:
+        executor = None
+        if workers != 1:
+            executor = stack.enter_context(ThreadPoolExecutor(max_workers=workers))
+        for name, lineno, block in _blocks(args.files, args.blocksize, stdin):
+            stats.read += len(block)
+            lines = [stripped for line in block if (stripped := line.strip())]
+            try:
+                parsed = parse_many(
+                    from_type,
+                    lines,
+                    max_workers=workers,
+                    chunksize=args.chunksize,
+                    executor=executor,
+                    interner=interner,
+                )
+            except MalformedCoordinates:
+                parsed = _parse_lines(
+                    from_type,
+                    name,
+                    lineno,
+                    block,
+                    stats,
+                    args.skip_invalid,
+                    stderr,
+                    interner,
+                )
+            if names is not None:
+                parsed = [c for c in parsed if c.name in names]
+            if arches is not None:
+                parsed = [c for c in parsed if getattr(c, "arch", "") in arches]
+            if to_type is not from_type:
+                parsed = list(_convert(parsed, to_type))
+            if args.unique and not args.sort:
+                parsed = _first_seen(parsed, seen)
+            if args.sort:
+                kept.extend(parsed)
+            else:
+                _write(stdout, parsed, stats)
+    if args.sort:
+        if args.unique:
+            kept = list(dict.fromkeys(kept))
+        # the sort is stable, so versions RPM considers equal like `1.0` and `1.00`
+        # keep their input order
+        kept.sort(key=_sort_key())
+        _write(stdout, kept, stats)
+
+
+def _write(stdout: TextIO, coordinates: list[NVR], stats: _Stats) -> None:
+    if coordinates:
+        stdout.write("\n".join(map(str, coordinates)))
+        stdout.write("\n")
+        stats.written += len(coordinates)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the `pkgps` command.
+
+    Args:
+        argv: The command line arguments, excluding the program name. Defaults to
+            `sys.argv[1:]`.
+
+    Returns:
+        The exit status: 0 on success, 1 if input couldn't be read, decoded, or
+        parsed. Input that can't be decoded fails the run even with
+        `--skip-invalid`.
+    """
+    parser = _parser()
+    args = parser.parse_args(argv)
+    from_type = _TYPES[args.from_type]
+    to_type = _TYPES[args.to_type or args.from_type]
+    if from_type not in _WITH_ARCH:
+        if to_type in _WITH_ARCH:
+            parser.error(
+                f"can't convert {from_type.__name__} to {to_type.__name__}: "
+                "the input has no arch"
+            )
+        if args.arches:
+            parser.error(f"can't filter {from_type.__name__} by arch")
+    for option in ("workers", "chunksize", "blocksize"):
+        value = getattr(args, option)
+        if value is not None and value < 1:
+            parser.error(f"--{option} must be at least 1, got {value}")
+
+    stats = _Stats()
+    try:
+        _run(args, from_type, to_type, sys.stdin, sys.stdout, sys.stderr, stats)
+        sys.stdout.flush()
+    except (MalformedCoordinates, _UnreadableInput) as e:
+        sys.stderr.write(f"{e}\n")
+        return 1
+    except BrokenPipeError:
+        # the reader went away e.g. `pkgps ... | head`, which is not an error. Point
+        # stdout at nothing so the interpreter's own flush at exit can't fail again.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except OSError as oe:
+        sys.stderr.write(f"pkgps: {oe}\n")
+        return 1
+    finally:
+        if args.stats:
+            stats.report(sys.stderr)
+    return 0
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+__all__ = ["Deb"]
+
+import re
+from collections.abc import Mapping
+from functools import cached_property
+from itertools import chain
+from typing import Any, cast
+
+from attr import asdict, field, frozen
+from attr.validators import ge
+
+from .nvr import (
+    _DEFAULT_LIMITS,
+    ParseLimits,
+    _check_length,
+    _check_nvr,
+    _malformed_coordinates,
+    _split_epoch,
+)
+
+_FRAGMENTS = re.compile(r"(\D*)(\d*)")
+
+# Characters Debian policy allows in each part of a version. Colons may only appear in
+# the upstream version if there is an epoch, which is already the case for any colon
+# left after the epoch has been split off.
+_UPSTREAM_VERSION = re.compile(r"[A-Za-z0-9.+~:-]+")
+_DEBIAN_REVISION = re.compile(r"[A-Za-z0-9.+~]*")
+
+_LABELS = ("name", "upstream_version", "debian_revision")
+
+# Weights dpkg gives characters outside of digit runs: `~` sorts before everything,
+# even the end of the string, then letters, then everything else. No weight is 0, which
+# is what a digit or the end of the string weighs.
+_WEIGHTS: dict[str, int] = {
+    **{chr(c): c + 256 for c in range(128)},
+    **{chr(c): c for c in range(ord("A"), ord("Z") + 1)},
+    **{chr(c): c for c in range(ord("a"), ord("z") + 1)},
+    "~": -1,
+}
+
+# The fragment an exhausted string compares as. Every fragment after the first starts
+# with a non-digit, so only the first fragment can equal it.
+_END = (0, 0)
+
+
+def _dpkg_key(fragment: str) -> tuple[int, ...]:
+    """Build a key which orders version fragments the way dpkg's `verrevcmp` does.
+
+    dpkg splits versions in to alternating runs of non-digits and digits. Each run of
+    non-digits becomes its weights followed by a 0, and each run of digits its value.
+    Because no weight is 0 the key can be flat, which is much quicker to compare than
+    nested tuples.
+    """
+    weights = _WEIGHTS
+    fragments = [
+        (*(weights.get(c, ord(c) + 256) for c in letters), 0, int(digits or 0))
+        for letters, digits in _FRAGMENTS.findall(fragment)
+        if letters or digits
+    ]
+    # dpkg compares as if both strings were padded with `_END` forever. Trailing `_END`s
+    # don't change the order, and a single `_END` stands in for the padding...
+    while fragments and fragments[-1] == _END:
+        fragments.pop()
+    # ...unless the key is all padding, because a version like `0~` has `_END` as its
+    # first fragment and the comparison must carry on past it.
+    fragments.append(_END)
+    if len(fragments) == 1:
+        fragments.append(_END)
+    return tuple(chain.from_iterable(fragments))
+
+
+@frozen(kw_only=True)
+class Deb:
+    """A class representing Debian package name_version coordinates.
+
+    Versions take the form `[epoch:]upstream_version[-debian_revision]`.
+
+    Instances are ordered by name and then by version, using dpkg's rules for comparing
+    versions. The key used to compare versions is built once per instance and cached,
+    so sorting large collections doesn't re-tokenize versions on every comparison.
+
+    Note that equality is structural: versions dpkg considers equal like `1.0` and
+    `1.00` compare neither less nor greater than each other but are not `==`.
+
+    This class supports iteration, allowing tuple-unpacking-like behavior in
+    assignment expressions e.g.
+
+    ```python
+    deb = Deb.from_string("curl_7.88.1-10+deb12u5")
+    name, epoch, upstream_version, debian_revision = deb
+    print(f"{name=} {epoch=} {upstream_version=} {debian_revision=}")
+    # name=curl epoch=0 upstream_version=7.88.1 debian_revision=10+deb12u5
+    ```
+    """
+
+    name: str
+    """Name."""
+    upstream_version: str
+    """Upstream version."""
+    debian_revision: str = ""
+    """Debian revision. Empty for native packages."""
+    epoch: int = field(default=0, validator=ge(0))
+    """Epoch."""
+
+    @classmethod
+    def from_string(cls, deb: str, *, limits: ParseLimits = _DEFAULT_LIMITS) -> Deb:
+        """Parse coordinates in the form `name_version`.
+
+        This is the start of a `.deb` file name, which goes on to add `_arch.deb`. The
+        architecture is not part of `Deb` coordinates and must be removed first.
+        """
+        _check_length(deb, cls.__name__, limits)
+        name, separator, version = deb.partition("_")
+        if not separator:
+            _malformed_coordinates(deb, cls.__name__)
+        return cls._from_parts(deb, name, version, limits)
+
+    @classmethod
+    def from_string_or_none(
+        cls, coordinate: str | None, *, limits: ParseLimits = _DEFAULT_LIMITS
+    ) -> Deb | None:
+        if coordinate is None:
+            return None
+        return cls.from_string(coordinate, limits=limits)
+
+    @classmethod
+    def from_version(
+        cls, name: str, version: str, *, limits: ParseLimits = _DEFAULT_LIMITS
+    ) -> Deb:
+        """Build coordinates from separate name and version strings.
+
+        This matches the `Package` and `Version` fields of a Debian `Packages` index.
+        """
+        coordinates = f"{name}_{version}"
+        _check_length(coordinates, cls.__name__, limits)
+        return cls._from_parts(coordinates, name, version, limits)
+
+    @classmethod
+    def _from_parts(
+        cls, coordinates: str, name: str, version: str, limits: ParseLimits
+    ) -> Deb:
+        e, rest = _split_epoch(coordinates, cls.__name__, limits, version)
+        upstream, separator, revision = rest.rpartition("-")
+        if not separator:
+            upstream, revision = rest, ""
+        if not name or not upstream or (separator and not revision):
+            _malformed_coordinates(coordinates, cls.__name__)
+        _check_nvr(
+            coordinates,
+            cls.__name__,
+            limits,
+            name,
+            upstream,
+            revision,
+            labels=_LABELS,
+        )
+        if not _UPSTREAM_VERSION.fullmatch(upstream):
+            _malformed_coordinates(
+                coordinates, cls.__name__, reason="invalid upstream_version characters"
+            )
+        if not _DEBIAN_REVISION.fullmatch(revision):
+            _malformed_coordinates(
+                coordinates, cls.__name__, reason="invalid debian_revision characters"
+            )
+        return cls(
+            name=name, epoch=e, upstream_version=upstream, debian_revision=revision
+        )
+
+    @property
+    def version(self) -> str:
+        """The full version, `[epoch:]upstream_version[-debian_revision]`."""
+        epoch_string = f"{self.epoch}:" if self.epoch else ""
+        revision_string = f"-{self.debian_revision}" if self.debian_revision else ""
+        return f"{epoch_string}{self.upstream_version}{revision_string}"
+
+    @property
+    def version_key(self) -> tuple[int, ...]:
+        """A key which orders versions the way dpkg does.
+
+        Use it to sort or compare versions of coordinates regardless of their names.
+        """
+        return cast("tuple[int, ...]", self._sort_key[1:])
+
+    @cached_property
+    def _sort_key(self) -> tuple[str | int, ...]:
+        # Neither fragment key can be a prefix of another, so they can be concatenated
+        # without a separator.
+        return (
+            self.name,
+            self.epoch,
+            *_dpkg_key(self.upstream_version),
+            *_dpkg_key(self.debian_revision),
+        )
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Deb):
+            return NotImplemented
+        return self._sort_key < other._sort_key
+
+    def __le__(self, other: Any) -> bool:
+        if not isinstance(other, Deb):
+            return NotImplemented
+        return self._sort_key <= other._sort_key
+
+    def __gt__(self, other: Any) -> bool:
+        if not isinstance(other, Deb):
+            return NotImplemented
+        return self._sort_key > other._sort_key
+
+    def __ge__(self, other: Any) -> bool:
+        if not isinstance(other, Deb):
+            return NotImplemented
+        return self._sort_key >= other._sort_key
+
+    def __str__(self) -> str:
+        return f"{self.name}_{self.version}"
+
+    def __iter__(self):
+        return iter(
+            (self.name, self.epoch, self.upstream_version, self.debian_revision)
+        )
+
+    def to_dict(self) -> Mapping[str, str | int]:
+        return asdict(self)
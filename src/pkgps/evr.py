@@ -0,0 +1,79 @@
+"""Ordering of RPM coordinates by epoch, version, and release.
+
+RPM compares versions and releases with `rpmvercmp`, which splits them in to runs of
+letters and runs of digits and compares those run by run. `evr_key` turns coordinates
+in to a key with the same ordering, so that collections can be sorted without calling a
+comparison function for every pair e.g.
+
+```python
+newest = max(candidates, key=evr_key)
+```
+"""
+
+from __future__ import annotations
+
+__all__ = ["evr_key", "rpmvercmp", "version_key"]
+
+import re
+
+from .nvr import NVR
+
+_SEGMENTS = re.compile(r"[0-9]+|[a-zA-Z]+|[~^]")
+
+# Each segment of a version becomes a tag, followed by the segment's value for letters
+# and digits. Tags order segments the way rpmvercmp does: `~` sorts before the end of
+# the version, `^` after it, and anything alphanumeric after both with digits newer
+# than letters.
+_TILDE = 0
+_END = 1
+_CARET = 2
+_ALPHA = 3
+_DIGITS = 4
+
+
+def version_key(version: str) -> tuple[int | str, ...]:
+    """Build a key which orders versions or releases the way `rpmvercmp` does.
+
+    The key is flat. Tags are never equal to the end tag except at the very end, so
+    keys of different versions can't be prefixes of one another and can be
+    concatenated safely.
+    """
+    key: list[int | str] = []
+    for segment in _SEGMENTS.findall(version):
+        if segment == "~":
+            key.append(_TILDE)
+        elif segment == "^":
+            key.append(_CARET)
+        elif segment[0].isdigit():
+            key.append(_DIGITS)
+            key.append(int(segment))
+        else:
+            key.append(_ALPHA)
+            key.append(segment)
+    key.append(_END)
+    return tuple(key)
+
+
+def _evr_key(epoch: int, version: str, release: str) -> tuple[int | str, ...]:
+    return (epoch, *version_key(version), *version_key(release))
+
+
+def evr_key(coordinates: NVR) -> tuple[int | str, ...]:
+    """Build a key which orders coordinates by epoch, then version, then release.
+
+    Coordinates without an epoch are treated as having an epoch of 0.
+    """
+    return _evr_key(
+        getattr(coordinates, "epoch", 0), coordinates.version, coordinates.release
+    )
+
+
+def rpmvercmp(a: str, b: str) -> int:
+    """Compare two versions or releases the way RPM does.
+
+    Returns:
+        A negative number if `a` is older than `b`, zero if they are equal, and a
+        positive number if `a` is newer than `b`.
+    """
+    key_a, key_b = version_key(a), version_key(b)
+    return (key_a > key_b) - (key_a < key_b)
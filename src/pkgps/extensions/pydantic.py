@@ -7,32 +7,50 @@ a top-level dependency for their project.
 
 from __future__ import annotations
 
-try:
-    from pydantic import BaseModel, GetCoreSchemaHandler
-except ImportError as ie:
-    raise ImportError(
-        "Please install pkgps[pydantic] to enable pydantic extensions."
-    ) from ie
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
 
-try:
-    from pydantic_core import CoreSchema
-except ImportError as ie:
-    raise ImportError(
-        "Please install pkgps[pydantic] to enable pydantic extensions."
-    ) from ie
-
-from pydantic_core.core_schema import (
-    chain_schema,
-    is_instance_schema,
-    json_or_python_schema,
-    no_info_plain_validator_function,
-    str_schema,
-    to_string_ser_schema,
-    union_schema,
-)
+# Only check that Pydantic is installed here. Importing `pydantic` and building core
+# schemas is deferred until Pydantic asks for a schema, by which point the caller has
+# already paid for importing `pydantic` themselves.
+if find_spec("pydantic") is None or find_spec("pydantic_core") is None:
+    raise ImportError("Please install pkgps[pydantic] to enable pydantic extensions.")
 
+from .._exceptions import MalformedCoordinates
+from ..deb import Deb
 from ..nvr import NEVR, NEVRA, NVR, NVRA
 
+if TYPE_CHECKING:
+    from pydantic import BaseModel, GetCoreSchemaHandler
+    from pydantic_core import CoreSchema
+
+
+def _coordinates_schema(type_: type[NVR | Deb]) -> CoreSchema:
+    from pydantic_core.core_schema import (
+        chain_schema,
+        is_instance_schema,
+        json_or_python_schema,
+        no_info_plain_validator_function,
+        str_schema,
+        to_string_ser_schema,
+        union_schema,
+    )
+
+    def validate(coordinates: str) -> NVR | Deb:
+        # Pydantic only reports `ValueError`s and `AssertionError`s as validation
+        # errors, anything else escapes model validation as-is
+        try:
+            return type_.from_string(coordinates)
+        except MalformedCoordinates as mc:
+            raise ValueError(str(mc)) from mc
+
+    schema = chain_schema([str_schema(), no_info_plain_validator_function(validate)])
+    return json_or_python_schema(
+        json_schema=schema,
+        python_schema=union_schema([is_instance_schema(type_), schema]),
+        serialization=to_string_ser_schema(),
+    )
+
 
 class NevrSchema:
     """Use with `pydantic.BaseModel` types for NEVR-type fields.
@@ -50,14 +68,7 @@ class NevrSchema:
     def __get_pydantic_core_schema__(
         cls, _: type[BaseModel], __: GetCoreSchemaHandler
     ) -> CoreSchema:
-        schema = chain_schema(
-            [str_schema(), no_info_plain_validator_function(NEVR.from_string)]
-        )
-        return json_or_python_schema(
-            json_schema=schema,
-            python_schema=union_schema([is_instance_schema(NEVR), schema]),
-            serialization=to_string_ser_schema(),
-        )
+        return _coordinates_schema(NEVR)
 
 
 class NevraSchema:
@@ -76,14 +87,7 @@ class NevraSchema:
     def __get_pydantic_core_schema__(
         cls, _: type[BaseModel], __: GetCoreSchemaHandler
     ) -> CoreSchema:
-        schema = chain_schema(
-            [str_schema(), no_info_plain_validator_function(NEVRA.from_string)]
-        )
-        return json_or_python_schema(
-            json_schema=schema,
-            python_schema=union_schema([is_instance_schema(NEVRA), schema]),
-            serialization=to_string_ser_schema(),
-        )
+        return _coordinates_schema(NEVRA)
 
 
 class NvrSchema:
@@ -102,14 +106,7 @@ class NvrSchema:
     def __get_pydantic_core_schema__(
         cls, _: type[BaseModel], __: GetCoreSchemaHandler
     ) -> CoreSchema:
-        schema = chain_schema(
-            [str_schema(), no_info_plain_validator_function(NVR.from_string)]
-        )
-        return json_or_python_schema(
-            json_schema=schema,
-            python_schema=union_schema([is_instance_schema(NVR), schema]),
-            serialization=to_string_ser_schema(),
-        )
+        return _coordinates_schema(NVR)
 
 
 class NvraSchema:
@@ -128,11 +125,23 @@ class NvraSchema:
     def __get_pydantic_core_schema__(
         cls, _: type[BaseModel], __: GetCoreSchemaHandler
     ) -> CoreSchema:
-        schema = chain_schema(
-            [str_schema(), no_info_plain_validator_function(NVRA.from_string)]
-        )
-        return json_or_python_schema(
-            json_schema=schema,
-            python_schema=union_schema([is_instance_schema(NVRA), schema]),
-            serialization=to_string_ser_schema(),
-        )
+        return _coordinates_schema(NVRA)
+
+
+class DebSchema:
+    """Use with `pydantic.BaseModel` types for Debian-type fields.
+
+    This type implements some Pydantic dunders to extend the Deb type for Pydantic
+    de/serialization.
+
+    Thanks to the maintainers of the `semver` Python project for figuring out this recipe [1].
+
+    See Also:
+        [1]: https://python-semver.readthedocs.io/en/latest/advanced/combine-pydantic-and-semver.html
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, _: type[BaseModel], __: GetCoreSchemaHandler
+    ) -> CoreSchema:
+        return _coordinates_schema(Deb)
@@ -0,0 +1,165 @@
+"""Compact probabilistic membership tests for large sets of coordinates.
+
+A `BloomFilter` answers "is this coordinate in the set?" using a small, fixed number of
+bits per member instead of holding every coordinate object in memory. It never reports
+a member as missing, but reports a non-member as present with a configurable
+false-positive rate. At a 1% false-positive rate it needs under 10 bits per member.
+
+```python
+vulnerable = BloomFilter.from_coordinates(known_vulnerable, fp_rate=0.001)
+flagged = [c for c, hit in zip(installed, vulnerable.contains_many(installed)) if hit]
+```
+
+Members are hashed by their canonical string form i.e. `str(coordinates)`, with a
+hash that is stable between processes and machines. Filters can be serialized with
+`to_bytes`, shipped elsewhere, and restored with `from_bytes`. As a consequence
+coordinates of different types with the same string form are indistinguishable, e.g.
+`NEVRA` coordinates with an epoch of 0 and the equivalent `NVRA` coordinates.
+"""
+
+from __future__ import annotations
+
+__all__ = ["BloomFilter"]
+
+import hashlib
+import math
+import struct
+from collections.abc import Collection, Iterable
+
+_HEADER = struct.Struct("<4sBHQQ")
+_MAGIC = b"PKBF"
+_FORMAT_VERSION = 1
+
+
+def _hashes(coordinates: object) -> tuple[int, int]:
+    digest = hashlib.blake2b(str(coordinates).encode(), digest_size=16).digest()
+    # an odd step guarantees the probes don't all collapse on to one bit when the
+    # number of bits is even
+    h = int.from_bytes(digest[:8], "little")
+    step = int.from_bytes(digest[8:], "little") | 1
+    return h, step
+
+
+class BloomFilter:
+    """A Bloom filter over the string form of coordinates.
+
+    Size the filter with the number of members you expect to add and the
+    false-positive rate you can tolerate. Adding more members than `capacity` still
+    works but the false-positive rate grows beyond `fp_rate`.
+    """
+
+    def __init__(self, capacity: int, fp_rate: float = 0.01) -> None:
+        if capacity < 0:
+            raise ValueError(f"capacity must not be negative, got {capacity}")
+        if not 0 < fp_rate < 1:
+            raise ValueError(f"fp_rate must be between 0 and 1, got {fp_rate}")
+        capacity = max(capacity, 1)
+        num_bits = math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2)
+        num_hashes = max(1, round(num_bits / capacity * math.log(2)))
+        self._init(num_bits, num_hashes, bytearray((num_bits + 7) // 8), 0)
+
+    def _init(
+        self, num_bits: int, num_hashes: int, bits: bytearray, count: int
+    ) -> None:
+        self._num_bits = num_bits
+        self._num_hashes = num_hashes
+        self._bits = bits
+        self._count = count
+
+    @classmethod
+    def from_coordinates(
+        cls, coordinates: Collection[object], fp_rate: float = 0.01
+    ) -> BloomFilter:
+        """Build a filter sized for and containing `coordinates`."""
+        bloom = cls(len(coordinates), fp_rate)
+        bloom.update(coordinates)
+        return bloom
+
+    @property
+    def num_bits(self) -> int:
+        """The number of bits in the filter."""
+        return self._num_bits
+
+    @property
+    def num_hashes(self) -> int:
+        """The number of bits set for each member."""
+        return self._num_hashes
+
+    @property
+    def false_positive_rate(self) -> float:
+        """The expected false-positive rate given the number of members added."""
+        k = self._num_hashes
+        return (1 - math.exp(-k * self._count / self._num_bits)) ** k
+
+    def __len__(self) -> int:
+        """The number of times a member was added, including duplicates."""
+        return self._count
+
+    def add(self, coordinates: object) -> None:
+        """Add `coordinates` to the filter."""
+        h, step = _hashes(coordinates)
+        bits, m = self._bits, self._num_bits
+        for _ in range(self._num_hashes):
+            index = h % m
+            bits[index >> 3] |= 1 << (index & 7)
+            h += step
+        self._count += 1
+
+    def update(self, coordinates: Iterable[object]) -> None:
+        """Add every member of `coordinates` to the filter."""
+        for c in coordinates:
+            self.add(c)
+
+    def __contains__(self, coordinates: object) -> bool:
+        h, step = _hashes(coordinates)
+        bits, m = self._bits, self._num_bits
+        for _ in range(self._num_hashes):
+            index = h % m
+            if not bits[index >> 3] & (1 << (index & 7)):
+                return False
+            h += step
+        return True
+
+    def contains_many(self, coordinates: Iterable[object]) -> list[bool]:
+        """Test each member of `coordinates` for membership, in order."""
+        bits, m, k = self._bits, self._num_bits, self._num_hashes
+        results = []
+        for c in coordinates:
+            h, step = _hashes(c)
+            for _ in range(k):
+                index = h % m
+                if not bits[index >> 3] & (1 << (index & 7)):
+                    results.append(False)
+                    break
+                h += step
+            else:
+                results.append(True)
+        return results
+
+    def to_bytes(self) -> bytes:
+        """Serialize the filter to a compact byte string."""
+        header = _HEADER.pack(
+            _MAGIC, _FORMAT_VERSION, self._num_hashes, self._num_bits, self._count
+        )
+        return header + bytes(self._bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> BloomFilter:
+        """Restore a filter serialized with `to_bytes`.
+
+        Raises:
+            ValueError: If `data` is not a serialized filter.
+        """
+        if len(data) < _HEADER.size:
+            raise ValueError("data is too short to be a serialized BloomFilter")
+        magic, version, num_hashes, num_bits, count = _HEADER.unpack_from(data)
+        if magic != _MAGIC:
+            raise ValueError("data is not a serialized BloomFilter")
+        if version != _FORMAT_VERSION:
+            raise ValueError(f"unsupported BloomFilter format version {version}")
+        bits = bytearray(data[_HEADER.size :])
+        if num_bits == 0 or num_hashes == 0 or len(bits) != (num_bits + 7) // 8:
+            raise ValueError("serialized BloomFilter is corrupt")
+        bloom = cls.__new__(cls)
+        bloom._init(num_bits, num_hashes, bits, count)
+        return bloom
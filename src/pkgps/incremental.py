@@ -0,0 +1,140 @@
+"""Incremental parsing of coordinate manifests.
+
+A manifest is a text file listing one set of coordinates per line, like the output of
+`rpm -qa`. Manifests collected from the same host usually differ by only a handful of
+lines between runs, so parsing every line again is mostly wasted work.
+
+`IncrementalParser` remembers the previous parse of a manifest and only parses lines
+it has not seen before. Each update reports the coordinates that were added and
+removed since the last one.
+
+```python
+parser = IncrementalParser(NEVRA)
+parser.update(["curl-1:7.76.1-26.el9.x86_64"])
+delta = parser.update(["curl-1:7.76.1-29.el9.x86_64"])
+print(delta.added, delta.removed)
+```
+"""
+
+from __future__ import annotations
+
+__all__ = ["CoordinateDelta", "IncrementalParser"]
+
+import hashlib
+from collections.abc import Collection, Iterable
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Generic, TypeVar, cast
+
+from attr import frozen
+
+from .nvr import _DEFAULT_LIMITS, NVR, ParseLimits
+
+if TYPE_CHECKING:
+    from .interning import Interner
+
+T = TypeVar("T", bound=NVR)
+
+
+@frozen(kw_only=True)
+class CoordinateDelta(Generic[T]):
+    """Coordinates added to and removed from a manifest between two updates.
+
+    A delta is falsy when nothing changed.
+    """
+
+    added: frozenset[T] = frozenset()
+    """Coordinates present after the update but not before it."""
+    removed: frozenset[T] = frozenset()
+    """Coordinates present before the update but not after it."""
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class IncrementalParser(Generic[T]):
+    """Parse successive versions of a manifest, reusing the previous parse.
+
+    Lines are stripped of surrounding whitespace and blank lines are ignored. A line
+    seen in the previous update is never parsed again; its coordinates are carried over
+    as-is. If parsing a new line fails the exception propagates and the parser keeps
+    the state from before the failed update.
+
+    New lines are parsed with `limits` and `interner`, see `ParseLimits` and
+    `Interner`.
+    """
+
+    def __init__(
+        self,
+        type_: type[T],
+        *,
+        limits: ParseLimits = _DEFAULT_LIMITS,
+        interner: Interner | None = None,
+    ) -> None:
+        self._type = type_
+        self._limits = limits
+        self._interner = interner
+        self._parsed: dict[str, T] = {}
+        self._coordinates: frozenset[T] = frozenset()
+        self._digest: bytes | None = None
+
+    @property
+    def coordinates(self) -> Collection[T]:
+        """The distinct coordinates from the most recent update.
+
+        Coordinates spelled by more than one line appear once.
+        """
+        return self._coordinates
+
+    def update(self, lines: Iterable[str]) -> CoordinateDelta[T]:
+        """Replace the remembered manifest with `lines` and return what changed."""
+        delta = self._update(lines)
+        self._digest = None
+        return delta
+
+    def update_file(
+        self, path: str | PathLike[str], encoding: str = "utf-8"
+    ) -> CoordinateDelta[T]:
+        """Replace the remembered manifest with the contents of the file at `path`.
+
+        A digest of the file's contents is kept between calls so an unchanged file is
+        detected without looking at any of its lines.
+        """
+        content = Path(path).read_bytes()
+        digest = hashlib.blake2b(content, digest_size=16).digest()
+        if digest == self._digest:
+            return CoordinateDelta()
+        delta = self._update(content.decode(encoding).splitlines())
+        self._digest = digest
+        return delta
+
+    def reset(self) -> None:
+        """Forget the remembered manifest."""
+        self._parsed = {}
+        self._coordinates = frozenset()
+        self._digest = None
+
+    def _update(self, lines: Iterable[str]) -> CoordinateDelta[T]:
+        previous = self._parsed
+        current: dict[str, T] = {}
+        parse = self._type.from_string
+        limits = self._limits
+        interner = self._interner
+        parsed: set[T] = set()
+        for raw in lines:
+            line = raw.strip()
+            if not line or line in current:
+                continue
+            if line in previous:
+                current[line] = previous[line]
+                continue
+            coordinate = cast(T, parse(line, limits=limits, interner=interner))
+            parsed.add(coordinate)
+            current[line] = coordinate
+        # Membership is per coordinate, not per line: two different lines can spell
+        # the same coordinates e.g. with an explicit `0:` epoch.
+        before = self._coordinates
+        after = frozenset(current.values())
+        self._parsed = current
+        self._coordinates = after
+        return CoordinateDelta(added=frozenset(parsed - before), removed=before - after)
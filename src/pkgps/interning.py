@@ -0,0 +1,104 @@
+"""Share component strings between parsed coordinates.
+
+Large collections of coordinates repeat the same components over and over: a fleet
+inventory of millions of `NEVRA` objects may have only tens of thousands of distinct
+names and a handful of distinct architectures. Every call to `from_string` allocates
+new strings for each component though, so each coordinate pays for its own copies.
+
+An `Interner` keeps a pool of canonical strings per component. Passing one to
+`from_string` makes the parsed coordinates reference the pooled strings instead of
+fresh copies e.g.
+
+```python
+interner = Interner()
+coordinates = [NEVRA.from_string(line, interner=interner) for line in lines]
+```
+
+Pools are bounded: once a pool is full new strings are returned as-is rather than
+added, so memory held by the pool never exceeds its size. Pools can be cleared at any
+time without affecting coordinates already parsed.
+
+Pools are safe to share between threads. Lookups take no lock, and inserting in to a
+pool only takes that pool's own lock, so threads parsing concurrently don't serialize
+on a single global lock.
+"""
+
+from __future__ import annotations
+
+__all__ = ["ComponentPool", "Interner"]
+
+import threading
+
+
+class ComponentPool:
+    """A bounded pool of canonical strings for one component of coordinates.
+
+    Calling the pool with a string returns the pooled string equal to it, adding it to
+    the pool first if there is room.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+        self._maxsize = maxsize
+        self._pool: dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def maxsize(self) -> int:
+        """The maximum number of strings kept in the pool."""
+        return self._maxsize
+
+    def __call__(self, value: str) -> str:
+        canonical = self._pool.get(value)
+        if canonical is not None:
+            return canonical
+        if len(self._pool) >= self._maxsize:
+            return value
+        with self._lock:
+            # re-check under the lock so concurrent inserts can't overfill the pool
+            if len(self._pool) >= self._maxsize:
+                return self._pool.get(value, value)
+            return self._pool.setdefault(value, value)
+
+    def __len__(self) -> int:
+        return len(self._pool)
+
+    def __contains__(self, value: object) -> bool:
+        return value in self._pool
+
+    def clear(self) -> None:
+        """Remove every string from the pool."""
+        with self._lock:
+            self._pool = {}
+
+
+class Interner:
+    """A set of `ComponentPool`s, one per component of the `NVR` family of coordinates.
+
+    The default sizes comfortably hold the distinct components of a large fleet of
+    RPM-based hosts. Epochs are integers and are not pooled; CPython already shares
+    small integers.
+    """
+
+    def __init__(
+        self,
+        *,
+        names: int = 65_536,
+        versions: int = 262_144,
+        releases: int = 524_288,
+        arches: int = 256,
+    ) -> None:
+        self.name = ComponentPool(names)
+        """Pool of names."""
+        self.version = ComponentPool(versions)
+        """Pool of versions."""
+        self.release = ComponentPool(releases)
+        """Pool of releases."""
+        self.arch = ComponentPool(arches)
+        """Pool of architectures."""
+
+    def clear(self) -> None:
+        """Remove every string from every pool."""
+        for pool in (self.name, self.version, self.release, self.arch):
+            pool.clear()
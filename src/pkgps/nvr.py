@@ -1,22 +1,140 @@
 from __future__ import annotations
 
-__all__ = ["NVR", "NEVR", "NVRA", "NEVRA"]
+__all__ = ["NVR", "NEVR", "NVRA", "NEVRA", "ParseLimits"]
 
 from collections.abc import Mapping
-from typing import NoReturn
+from typing import TYPE_CHECKING, NoReturn
 
 from attr import asdict, field, frozen
 from attr.validators import ge
 
 from ._exceptions import MalformedCoordinates
 
+if TYPE_CHECKING:
+    from .interning import Interner
+
+_MAX_OFFENDER_LENGTH = 128
+
 
 def _malformed_coordinates(
-    offender: str, type_: str, initiating_exception: Exception | None = None
+    offender: str,
+    type_: str,
+    initiating_exception: Exception | None = None,
+    reason: str | None = None,
 ) -> NoReturn:
-    raise MalformedCoordinates(
-        f"Malformed {type_} {offender}"
-    ) from initiating_exception
+    # offending input may be arbitrarily long, don't copy all of it in to the message
+    if len(offender) > _MAX_OFFENDER_LENGTH:
+        offender = f"{offender[:_MAX_OFFENDER_LENGTH]}... ({len(offender)} characters)"
+    message = f"Malformed {type_} {offender}"
+    if reason is not None:
+        message = f"{message}: {reason}"
+    raise MalformedCoordinates(message) from initiating_exception
+
+
+@frozen(kw_only=True)
+class ParseLimits:
+    """Maximum lengths accepted when parsing coordinates from strings.
+
+    Input longer than any of these limits is rejected with `MalformedCoordinates`
+    before any work proportional to its length beyond a single split is done. In
+    particular the epoch is only converted to an integer once it is known to be a
+    short run of ASCII digits, which keeps parsing linear in the length of the input.
+
+    The defaults are generous for real-world RPM coordinates. Pass a custom instance
+    to `from_string` when parsing input from untrusted sources to tighten them e.g.
+
+    ```python
+    NEVRA.from_string(untrusted, limits=ParseLimits(length=256, name=128))
+    ```
+    """
+
+    length: int = field(default=1024, validator=ge(0))
+    """Maximum length of the whole coordinate string."""
+    name: int = field(default=256, validator=ge(0))
+    """Maximum length of the name."""
+    epoch: int = field(default=10, validator=ge(0))
+    """Maximum number of digits in the epoch.
+
+    This only caps the length of the epoch, not its value, to keep converting it to an
+    integer cheap. Ten digits fit any RPM epoch but also allow larger values.
+    """
+    version: int = field(default=256, validator=ge(0))
+    """Maximum length of the version."""
+    release: int = field(default=256, validator=ge(0))
+    """Maximum length of the release."""
+    arch: int = field(default=32, validator=ge(0))
+    """Maximum length of the architecture."""
+
+
+_DEFAULT_LIMITS = ParseLimits()
+
+
+def _check_length(coordinates: str, type_: str, limits: ParseLimits) -> None:
+    if len(coordinates) > limits.length:
+        _malformed_coordinates(
+            coordinates, type_, reason=f"longer than {limits.length} characters"
+        )
+
+
+def _check_nvr(
+    coordinates: str,
+    type_: str,
+    limits: ParseLimits,
+    n: str,
+    v: str,
+    r: str,
+    *,
+    labels: tuple[str, str, str] = ("name", "version", "release"),
+) -> None:
+    name_label, version_label, release_label = labels
+    if len(n) > limits.name:
+        _malformed_coordinates(
+            coordinates,
+            type_,
+            reason=f"{name_label} longer than {limits.name} characters",
+        )
+    if len(v) > limits.version:
+        _malformed_coordinates(
+            coordinates,
+            type_,
+            reason=f"{version_label} longer than {limits.version} characters",
+        )
+    if len(r) > limits.release:
+        _malformed_coordinates(
+            coordinates,
+            type_,
+            reason=f"{release_label} longer than {limits.release} characters",
+        )
+
+
+def _check_arch(coordinates: str, type_: str, limits: ParseLimits, a: str) -> None:
+    if len(a) > limits.arch:
+        _malformed_coordinates(
+            coordinates, type_, reason=f"arch longer than {limits.arch} characters"
+        )
+
+
+def _split_epoch(
+    coordinates: str, type_: str, limits: ParseLimits, ev: str
+) -> tuple[int, str]:
+    # split here will result in at least a one-item list, meaning worst case `rest`
+    # will be an empty list
+    *rest, v = ev.split(":", 1)
+    if not rest:
+        return 0, v
+    return _parse_epoch(coordinates, type_, limits, rest[0]), v
+
+
+def _parse_epoch(coordinates: str, type_: str, limits: ParseLimits, e: str) -> int:
+    # `int` accepts signs, underscores, whitespace and non-ASCII digits, and converting
+    # long digit strings is superlinear, so validate before converting
+    if not (0 < len(e) <= limits.epoch and e.isascii() and e.isdigit()):
+        _malformed_coordinates(
+            coordinates,
+            type_,
+            reason=f"epoch must be 1 to {limits.epoch} ASCII digits",
+        )
+    return int(e)
 
 
 @frozen(kw_only=True)
@@ -43,20 +161,36 @@ class NVR:
     """Release."""
 
     @classmethod
-    def from_string(cls, nvr: str) -> NVR:
+    def from_string(
+        cls,
+        nvr: str,
+        *,
+        limits: ParseLimits = _DEFAULT_LIMITS,
+        interner: Interner | None = None,
+    ) -> NVR:
+        _check_length(nvr, cls.__name__, limits)
         try:
             n, v, r = nvr.rsplit("-", 2)
         except ValueError as ve:
             # Expected case: ValueError raised if there are not enough items
             # to unpack in to all of `n`, `v`, and `r`
             _malformed_coordinates(nvr, cls.__name__, initiating_exception=ve)
+        _check_nvr(nvr, cls.__name__, limits, n, v, r)
+        if interner is not None:
+            n, v, r = interner.name(n), interner.version(v), interner.release(r)
         return cls(name=n, version=v, release=r)
 
     @classmethod
-    def from_string_or_none(cls, coordinate: str | None) -> NVR | None:
+    def from_string_or_none(
+        cls,
+        coordinate: str | None,
+        *,
+        limits: ParseLimits = _DEFAULT_LIMITS,
+        interner: Interner | None = None,
+    ) -> NVR | None:
         if coordinate is None:
             return None
-        return cls.from_string(coordinate)
+        return cls.from_string(coordinate, limits=limits, interner=interner)
 
     def __str__(self) -> str:
         return f"{self.name}-{self.version}-{self.release}"
@@ -87,17 +221,24 @@ class NEVR(NVR):
     """Epoch."""
 
     @classmethod
-    def from_string(cls, nevr: str) -> NEVR:
+    def from_string(
+        cls,
+        nevr: str,
+        *,
+        limits: ParseLimits = _DEFAULT_LIMITS,
+        interner: Interner | None = None,
+    ) -> NEVR:
+        _check_length(nevr, cls.__name__, limits)
         try:
             n, ev, r = nevr.rsplit("-", 2)
         except ValueError as ve:
             # Expected case: ValueError raised if there are not enough items
             # to unpack in to all of `n`, `v`, and `r`
             _malformed_coordinates(nevr, cls.__name__, initiating_exception=ve)
-        # not wrapped in try/except because split here will result in at least a one-item
-        # list, meaning worst case `rest` will be an empty list
-        *rest, v = ev.split(":", 1)
-        e: int = int(rest[0]) if rest else 0
+        e, v = _split_epoch(nevr, cls.__name__, limits, ev)
+        _check_nvr(nevr, cls.__name__, limits, n, v, r)
+        if interner is not None:
+            n, v, r = interner.name(n), interner.version(v), interner.release(r)
         return cls(name=n, epoch=e, version=v, release=r)
 
     def __str__(self) -> str:
@@ -127,7 +268,14 @@ class NVRA(NVR):
     """Architecture."""
 
     @classmethod
-    def from_string(cls, nvra: str) -> NVRA:
+    def from_string(
+        cls,
+        nvra: str,
+        *,
+        limits: ParseLimits = _DEFAULT_LIMITS,
+        interner: Interner | None = None,
+    ) -> NVRA:
+        _check_length(nvra, cls.__name__, limits)
         try:
             n, v, ra = nvra.rsplit("-", 2)
             r, a = ra.rsplit(".", 1)
@@ -135,6 +283,11 @@ class NVRA(NVR):
             # Expected case: ValueError raised if there are not enough items
             # to unpack in to all of `n`, `v`, and `r`
             _malformed_coordinates(nvra, cls.__name__, initiating_exception=ve)
+        _check_nvr(nvra, cls.__name__, limits, n, v, r)
+        _check_arch(nvra, cls.__name__, limits, a)
+        if interner is not None:
+            n, v, r = interner.name(n), interner.version(v), interner.release(r)
+            a = interner.arch(a)
         return cls(name=n, version=v, release=r, arch=a)
 
     def __str__(self) -> str:
@@ -170,7 +323,14 @@ class NEVRA(NVR):
     """Epoch."""
 
     @classmethod
-    def from_string(cls, nevra: str) -> NEVRA:
+    def from_string(
+        cls,
+        nevra: str,
+        *,
+        limits: ParseLimits = _DEFAULT_LIMITS,
+        interner: Interner | None = None,
+    ) -> NEVRA:
+        _check_length(nevra, cls.__name__, limits)
         try:
             n, ev, ra = nevra.rsplit("-", 2)
             r, a = ra.rsplit(".", 1)
@@ -178,10 +338,12 @@ class NEVRA(NVR):
             # Expected case: ValueError raised if there are not enough items
             # to unpack in to all of `n`, `v`, and `r`
             _malformed_coordinates(nevra, cls.__name__, initiating_exception=ve)
-        # not wrapped in try/except because split here will result in at least a one-item
-        # list, meaning worst case `rest` will be an empty list
-        *rest, v = ev.split(":", 1)
-        e: int = int(rest[0]) if rest else 0
+        e, v = _split_epoch(nevra, cls.__name__, limits, ev)
+        _check_nvr(nevra, cls.__name__, limits, n, v, r)
+        _check_arch(nevra, cls.__name__, limits, a)
+        if interner is not None:
+            n, v, r = interner.name(n), interner.version(v), interner.release(r)
+            a = interner.arch(a)
         return cls(name=n, epoch=e, version=v, release=r, arch=a)
 
     def __str__(self) -> str:
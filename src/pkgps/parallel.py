@@ -0,0 +1,109 @@
+"""Parse coordinates from many threads at once.
+
+Parsing coordinates touches no shared mutable state: `from_string` only reads its
+argument and the resulting objects are frozen. Any number of threads can parse
+concurrently without coordinating with each other, and on free-threaded builds of
+CPython (3.13t and later) throughput scales with the number of threads.
+
+`parse_many` splits its input in to chunks and parses them on a thread pool. Chunks
+amortize the cost of handing work to the pool, which would otherwise dominate for
+inputs as short as package coordinates.
+"""
+
+from __future__ import annotations
+
+__all__ = ["parse_many"]
+
+from collections.abc import Iterable
+from concurrent.futures import Executor, ThreadPoolExecutor
+from itertools import chain
+from typing import TYPE_CHECKING, TypeVar, cast
+
+from .nvr import _DEFAULT_LIMITS, NVR, ParseLimits
+
+if TYPE_CHECKING:
+    from .interning import Interner
+
+T = TypeVar("T", bound=NVR)
+
+DEFAULT_CHUNKSIZE = 1024
+"""The default number of coordinates handed to a worker thread at a time."""
+
+
+def _parse_chunk(
+    type_: type[T], chunk: list[str], limits: ParseLimits, interner: Interner | None
+) -> list[T]:
+    parse = type_.from_string
+    return [
+        cast(T, parse(coordinate, limits=limits, interner=interner))
+        for coordinate in chunk
+    ]
+
+
+def parse_many(
+    type_: type[T],
+    coordinates: Iterable[str],
+    *,
+    max_workers: int | None = None,
+    chunksize: int = DEFAULT_CHUNKSIZE,
+    executor: Executor | None = None,
+    limits: ParseLimits = _DEFAULT_LIMITS,
+    interner: Interner | None = None,
+) -> list[T]:
+    """Parse `coordinates` as `type_` on a pool of threads.
+
+    Results are returned in input order. If any coordinates fail to parse the first
+    failure's exception is raised once all chunks have been parsed.
+
+    Args:
+        type_: The coordinate type to parse e.g. `NEVRA`.
+        coordinates: The strings to parse.
+        max_workers: The number of threads to start if `executor` is not given.
+            Defaults to the `ThreadPoolExecutor` default.
+        chunksize: How many coordinates each thread parses at a time.
+        executor: An existing executor to parse on. It is not shut down afterwards.
+        limits: The input limits passed to `from_string`.
+        interner: An optional `Interner` passed to `from_string`. Its pools are safe to
+            share between the worker threads.
+
+    Returns:
+        The parsed coordinates.
+    """
+    if chunksize < 1:
+        raise ValueError(f"chunksize must be at least 1, got {chunksize}")
+    items = coordinates if isinstance(coordinates, list) else list(coordinates)
+    chunks = [items[i : i + chunksize] for i in range(0, len(items), chunksize)]
+    if len(chunks) <= 1 or max_workers == 1:
+        return list(
+            chain.from_iterable(
+                _parse_chunk(type_, c, limits, interner) for c in chunks
+            )
+        )
+    if executor is not None:
+        return _parse_on(executor, type_, chunks, limits, interner)
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        return _parse_on(pool, type_, chunks, limits, interner)
+
+
+def _parse_on(
+    executor: Executor,
+    type_: type[T],
+    chunks: list[list[str]],
+    limits: ParseLimits,
+    interner: Interner | None,
+) -> list[T]:
+    futures = [
+        executor.submit(_parse_chunk, type_, chunk, limits, interner)
+        for chunk in chunks
+    ]
+    results: list[T] = []
+    error: BaseException | None = None
+    for future in futures:
+        exception = future.exception()
+        if exception is not None:
+            error = error or exception
+        elif error is None:
+            results.extend(future.result())
+    if error is not None:
+        raise error
+    return results
@@ -1,7 +1,14 @@
-from pydantic import BaseModel
+import pytest
+from pydantic import BaseModel, ValidationError
 
-from pkgps import NEVR, NEVRA, NVR, NVRA
-from pkgps.extensions.pydantic import NevraSchema, NevrSchema, NvraSchema, NvrSchema
+from pkgps import NEVR, NEVRA, NVR, NVRA, Deb
+from pkgps.extensions.pydantic import (
+    DebSchema,
+    NevraSchema,
+    NevrSchema,
+    NvraSchema,
+    NvrSchema,
+)
 
 
 class ModelWithNEVR(BaseModel):
@@ -154,3 +161,58 @@ def test_NvraSchema_serialization_to_json():  # noqa: N802
         nvra=NVRA(name="test", version="1.0.0", release="1.fc40", arch="aarch64")
     ).model_dump_json()
     assert actual == expected
+
+
+class ModelWithDeb(BaseModel):
+    deb: DebSchema
+
+
+# Ignore: ruff N802
+# Reason: These test cases are named to reflect the type that they are testing,
+#   which is why they use CamelCase.
+def test_DebSchema_validation_from_string():  # noqa: N802
+    expected = ModelWithDeb(
+        deb=Deb(name="test", epoch=1, upstream_version="1.0.0", debian_revision="1")
+    )
+    actual = ModelWithDeb.model_validate({"deb": "test_1:1.0.0-1"})
+    assert actual == expected
+
+
+# Ignore: ruff N802
+# Reason: These test cases are named to reflect the type that they are testing,
+#   which is why they use CamelCase.
+def test_DebSchema_validation_from_json():  # noqa: N802
+    expected = ModelWithDeb(
+        deb=Deb(name="test", epoch=1, upstream_version="1.0.0", debian_revision="1")
+    )
+    actual = ModelWithDeb.model_validate_json('{"deb":"test_1:1.0.0-1"}')
+    assert actual == expected
+
+
+# Ignore: ruff N802
+# Reason: These test cases are named to reflect the type that they are testing,
+#   which is why they use CamelCase.
+def test_DebSchema_serialization_to_json():  # noqa: N802
+    expected = '{"deb":"test_1:1.0.0-1"}'
+    actual = ModelWithDeb(
+        deb=Deb(name="test", epoch=1, upstream_version="1.0.0", debian_revision="1")
+    ).model_dump_json()
+    assert actual == expected
+
+
+@pytest.mark.parametrize(
+    "model,value",
+    [
+        (ModelWithNEVR, {"nevr": "curl-x:1-1"}),
+        (ModelWithNEVRA, {"nevra": "curl-x:1-1.x86_64"}),
+        (ModelWithNEVRA, {"nevra": "curl"}),
+        (ModelWithNVR, {"nvr": "curl"}),
+        (ModelWithNVRA, {"nvra": "curl-1-1"}),
+        (ModelWithDeb, {"deb": "curl_x:1-1"}),
+    ],
+)
+def test_malformed_coordinates_raise_validation_error(
+    model: type[BaseModel], value: dict[str, str]
+):
+    with pytest.raises(ValidationError, match="Malformed"):
+        model.model_validate(value)
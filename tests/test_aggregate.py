@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pkgps import NEVRA, MalformedCoordinates
+from pkgps.aggregate import (
+    FleetAggregate,
+    LaggingHost,
+    _aggregate_chunk,
+    _map_chunks,
+    aggregate_manifests,
+    find_lagging_hosts,
+)
+
+MANIFESTS = {
+    "web1": ["curl-7.76.1-29.el9.x86_64", "bash-5.1.8-9.el9.x86_64"],
+    "web2": ["curl-7.76.1-26.el9.x86_64", "bash-5.1.8-9.el9.x86_64", ""],
+    "db1": [
+        "curl-7.76.1-26.el9.x86_64",
+        "kernel-5.14.0-427.el9.x86_64",
+        "kernel-5.14.0-362.el9.x86_64",
+    ],
+    "db2": [
+        "kernel-5.14.0-362.el9.x86_64",
+        "kernel-5.14.0-284.el9.x86_64",
+        "curl-7.76.1-29.el9.i686",
+    ],
+}
+
+
+@pytest.fixture
+def manifests(tmp_path: Path) -> list[Path]:
+    paths = []
+    for host, lines in MANIFESTS.items():
+        path = tmp_path / f"{host}.txt"
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+@pytest.mark.parametrize("chunksize", [1, 64])
+def test_aggregate_manifests(manifests: list[Path], max_workers: int, chunksize: int):
+    fleet = aggregate_manifests(manifests, max_workers=max_workers, chunksize=chunksize)
+    assert fleet.hosts == 4
+    reports = {(r.name, r.arch): r for r in fleet.reports()}
+    assert list(reports) == sorted(reports)
+
+    curl = reports[("curl", "x86_64")]
+    assert curl.hosts == 3
+    assert curl.newest == NEVRA.from_string("curl-7.76.1-29.el9.x86_64")
+    assert curl.current == 1
+    assert curl.lagging == 2
+    assert [(str(c), n) for c, n in curl.versions] == [
+        ("curl-7.76.1-29.el9.x86_64", 1),
+        ("curl-7.76.1-26.el9.x86_64", 2),
+    ]
+
+    assert reports[("curl", "i686")].hosts == 1
+    assert reports[("bash", "x86_64")].lagging == 0
+
+    kernel = reports[("kernel", "x86_64")]
+    assert kernel.hosts == 2
+    assert [(str(c), n) for c, n in kernel.versions] == [
+        ("kernel-5.14.0-427.el9.x86_64", 1),
+        ("kernel-5.14.0-362.el9.x86_64", 2),
+        ("kernel-5.14.0-284.el9.x86_64", 1),
+    ]
+    assert kernel.lagging == 1
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_find_lagging_hosts(manifests: list[Path], max_workers: int):
+    fleet = aggregate_manifests(manifests, max_workers=max_workers, chunksize=1)
+    lagging = sorted(
+        find_lagging_hosts(manifests, fleet, max_workers=max_workers, chunksize=1),
+        key=lambda host: (host.host, host.installed.name),
+    )
+    assert lagging == [
+        LaggingHost(
+            host=str(manifests[2]),
+            installed=NEVRA.from_string("curl-7.76.1-26.el9.x86_64"),
+            newest=NEVRA.from_string("curl-7.76.1-29.el9.x86_64"),
+        ),
+        LaggingHost(
+            host=str(manifests[3]),
+            installed=NEVRA.from_string("kernel-5.14.0-362.el9.x86_64"),
+            newest=NEVRA.from_string("kernel-5.14.0-427.el9.x86_64"),
+        ),
+        LaggingHost(
+            host=str(manifests[1]),
+            installed=NEVRA.from_string("curl-7.76.1-26.el9.x86_64"),
+            newest=NEVRA.from_string("curl-7.76.1-29.el9.x86_64"),
+        ),
+    ]
+
+
+def test_add_host_counts_duplicates_once():
+    fleet = FleetAggregate()
+    curl = NEVRA.from_string("curl-7.76.1-29.el9.x86_64")
+    fleet.add_host([curl, curl])
+    (report,) = fleet.reports()
+    assert report.hosts == 1
+    assert report.versions == ((curl, 1),)
+
+
+def test_merge():
+    old = NEVRA.from_string("curl-7.76.1-26.el9.x86_64")
+    new = NEVRA.from_string("curl-1:7.0-1.el9.x86_64")
+    a, b = FleetAggregate(), FleetAggregate()
+    a.add_host([old])
+    b.add_host([new])
+    b.add_host([old])
+    assert a.merge(b) is a
+    assert a.hosts == 3
+    assert a.newest() == {("curl", "x86_64"): new}
+    (report,) = a.reports()
+    assert report.versions == ((new, 1), (old, 2))
+    # the merged counters are copies
+    assert b.hosts == 2
+    (report,) = b.reports()
+    assert report.hosts == 2
+
+
+def test_map_chunks_bounds_chunks_in_flight(manifests: list[Path]):
+    consumed = 0
+
+    def paths():
+        nonlocal consumed
+        for _ in range(50):
+            for path in manifests:
+                consumed += 1
+                yield path
+
+    results = _map_chunks(_aggregate_chunk, paths(), 2, 1)
+    next(results)
+    # two workers keep at most four chunks in flight, plus the one being submitted
+    assert consumed <= 5
+    assert sum(partial.hosts for partial in results) == 199
+
+
+def test_aggregate_manifests_empty():
+    fleet = aggregate_manifests([])
+    assert fleet.hosts == 0
+    assert list(fleet.reports()) == []
+
+
+def test_aggregate_manifests_malformed(tmp_path: Path):
+    path = tmp_path / "bad.txt"
+    path.write_text("not-coordinates\n", encoding="utf-8")
+    with pytest.raises(MalformedCoordinates):
+        aggregate_manifests([path], max_workers=1)
+
+
+def test_aggregate_manifests_chunksize():
+    with pytest.raises(ValueError, match="chunksize"):
+        aggregate_manifests([], chunksize=0)
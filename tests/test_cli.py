@@ -0,0 +1,223 @@
+from __future__ import annotations
+
+import io
+import os
+
+# Ignore: bandit B404
+# Reason: The tests only run the current interpreter with fixed arguments.
+import subprocess  # nosec B404
+import sys
+from pathlib import Path
+
+import pytest
+
+from pkgps import NEVRA, Interner
+from pkgps.cli import _parse_lines, _sort_key, _Stats, main
+from pkgps.evr import evr_key
+
+INPUT = """\
+curl-1:7.76.1-26.el9.x86_64
+  bash-5.1.8-9.el9.x86_64
+
+curl-0:7.76.1-29.el9.i686
+curl-7.76.1-29.el9.x86_64
+bash-5.1.8-9.el9.x86_64
+curl-1:7.76.1-26.el9~beta.x86_64
+"""
+
+
+def _run(
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    *args: str,
+    stdin: str = INPUT,
+) -> tuple[int, list[str], str]:
+    monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+    status = main(list(args))
+    out, err = capsys.readouterr()
+    return status, out.splitlines(), err
+
+
+def test_normalizes(monkeypatch, capsys):
+    status, out, err = _run(monkeypatch, capsys)
+    assert status == 0
+    assert err == ""
+    assert out == [
+        "curl-1:7.76.1-26.el9.x86_64",
+        "bash-5.1.8-9.el9.x86_64",
+        "curl-7.76.1-29.el9.i686",
+        "curl-7.76.1-29.el9.x86_64",
+        "bash-5.1.8-9.el9.x86_64",
+        "curl-1:7.76.1-26.el9~beta.x86_64",
+    ]
+
+
+def test_sort_unique(monkeypatch, capsys):
+    status, out, _ = _run(monkeypatch, capsys, "--sort", "--unique")
+    assert status == 0
+    assert out == [
+        "bash-5.1.8-9.el9.x86_64",
+        "curl-7.76.1-29.el9.i686",
+        "curl-7.76.1-29.el9.x86_64",
+        "curl-1:7.76.1-26.el9~beta.x86_64",
+        "curl-1:7.76.1-26.el9.x86_64",
+    ]
+
+
+def test_unique_keeps_input_order(monkeypatch, capsys):
+    _, out, _ = _run(monkeypatch, capsys, "-u", "--to", "nvr")
+    assert out == [
+        "curl-7.76.1-26.el9",
+        "bash-5.1.8-9.el9",
+        "curl-7.76.1-29.el9",
+        "curl-7.76.1-26.el9~beta",
+    ]
+
+
+@pytest.mark.parametrize(
+    "args,expected",
+    [
+        (
+            ["--name", "curl", "--arch", "x86_64"],
+            [
+                "curl-1:7.76.1-26.el9.x86_64",
+                "curl-7.76.1-29.el9.x86_64",
+                "curl-1:7.76.1-26.el9~beta.x86_64",
+            ],
+        ),
+        (["-n", "bash", "-n", "zsh", "-t", "NEVR"], ["bash-5.1.8-9.el9"] * 2),
+        (["-a", "i686", "-t", "nvra"], ["curl-7.76.1-29.el9.i686"]),
+        (["-n", "zsh"], []),
+    ],
+)
+def test_filters(monkeypatch, capsys, args: list[str], expected: list[str]):
+    status, out, _ = _run(monkeypatch, capsys, *args)
+    assert status == 0
+    assert out == expected
+
+
+def test_from_nvr(monkeypatch, capsys):
+    stdin = "curl-7.76.1-29.el9\ncurl-7.76.1-26.el9\n"
+    _, out, _ = _run(monkeypatch, capsys, "-f", "NVR", "-t", "NEVR", "-s", stdin=stdin)
+    assert out == ["curl-7.76.1-26.el9", "curl-7.76.1-29.el9"]
+
+
+@pytest.mark.parametrize(
+    "args,message",
+    [
+        (["-f", "NVR", "-t", "NVRA"], "can't convert NVR to NVRA"),
+        (["-f", "NEVR", "--arch", "x86_64"], "can't filter NEVR by arch"),
+        (["--workers", "0"], "--workers must be at least 1"),
+        (["--to", "GAV"], "invalid choice"),
+    ],
+)
+def test_usage_errors(monkeypatch, capsys, args: list[str], message: str):
+    with pytest.raises(SystemExit) as exit_info:
+        _run(monkeypatch, capsys, *args)
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("blocksize", [2, 1024])
+def test_malformed_reports_line(monkeypatch, capsys, blocksize: int):
+    stdin = INPUT + "kernel\n"
+    status, _, err = _run(
+        monkeypatch, capsys, "--blocksize", str(blocksize), stdin=stdin
+    )
+    assert status == 1
+    assert err.startswith("pkgps: <stdin>:8: ")
+    assert "kernel" in err
+
+
+def test_skip_invalid(monkeypatch, capsys):
+    stdin = "kernel\ncurl-7.76.1-29.el9.x86_64\nbash\n"
+    status, out, err = _run(
+        monkeypatch, capsys, "--skip-invalid", "--stats", stdin=stdin
+    )
+    assert status == 0
+    assert out == ["curl-7.76.1-29.el9.x86_64"]
+    lines = err.splitlines()
+    assert lines[0].startswith("pkgps: <stdin>:1: ")
+    assert lines[1].startswith("pkgps: <stdin>:3: ")
+    assert "read 3 lines" in lines[2]
+    assert "wrote 1, 2 invalid" in lines[2]
+
+
+def test_fallback_parse_uses_interner():
+    interner = Interner()
+    lines = ["curl-7.76.1-29.el9.x86_64\n", "kernel\n"]
+    errors = io.StringIO()
+    parsed = _parse_lines(NEVRA, "<stdin>", 1, lines, _Stats(), True, errors, interner)
+    assert parsed == [NEVRA.from_string("curl-7.76.1-29.el9.x86_64")]
+    assert "curl" in interner.name
+    assert "<stdin>:2" in errors.getvalue()
+
+
+def test_sort_key_orders_like_evr_key():
+    coordinates = [
+        NEVRA.from_string(c)
+        for c in (
+            "curl-1:1.0-1.x86_64",
+            "curl-2.0-1.x86_64",
+            "curl-1.0~rc1-1.x86_64",
+            "curl-1.0^git1-1.x86_64",
+            "curl-1.0-1.x86_64",
+            "curl-1.0-1.el9.x86_64",
+        )
+    ]
+    key = _sort_key()
+    assert sorted(coordinates, key=key) == sorted(coordinates, key=evr_key)
+
+
+def test_reads_files_and_stdin(monkeypatch, capsys, tmp_path: Path):
+    first = tmp_path / "first.txt"
+    first.write_text("zsh-5.8-9.el9.x86_64\n", encoding="utf-8")
+    status, out, _ = _run(
+        monkeypatch, capsys, str(first), "-", "-s", stdin="bash-5.1.8-9.el9.x86_64\n"
+    )
+    assert status == 0
+    assert out == ["bash-5.1.8-9.el9.x86_64", "zsh-5.8-9.el9.x86_64"]
+
+
+def test_missing_file(monkeypatch, capsys, tmp_path: Path):
+    status, out, err = _run(monkeypatch, capsys, str(tmp_path / "missing.txt"))
+    assert status == 1
+    assert out == []
+    assert err.startswith("pkgps: ")
+
+
+@pytest.mark.parametrize("extra", [[], ["--skip-invalid"]])
+def test_undecodable_file(monkeypatch, capsys, tmp_path: Path, extra: list[str]):
+    path = tmp_path / "latin1.txt"
+    path.write_bytes(b"curl-7.76.1-29.el9.x86_64\nbad\xff-1.0-1.el9.x86_64\n")
+    status, _, err = _run(monkeypatch, capsys, str(path), *extra)
+    assert status == 1
+    assert err.startswith(f"pkgps: {path}: ")
+    assert "can't decode" in err
+
+
+@pytest.mark.parametrize("workers", ["1", "3"])
+def test_workers(monkeypatch, capsys, workers: str):
+    stdin = "".join(f"pkg{i}-1.{i}-1.el9.x86_64\n" for i in range(500))
+    status, out, _ = _run(
+        monkeypatch,
+        capsys,
+        *("-j", workers, "--chunksize", "7", "--blocksize", "100"),
+        stdin=stdin,
+    )
+    assert status == 0
+    assert out == stdin.splitlines()
+
+
+def test_module_entry_point():
+    # Ignore: bandit B603
+    # Reason: The command is always `sys.executable -m pkgps` with fixed arguments.
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-m", "pkgps", "--to", "NVR"],
+        input="curl-1:8.6.0-7.fc40.x86_64\n",
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    assert result.stdout == "curl-8.6.0-7.fc40\n"
@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+from itertools import product
+
+import pytest
+
+import pkgps.deb
+from pkgps import Deb, MalformedCoordinates, ParseLimits
+
+
+@pytest.mark.parametrize(
+    "deb,expected",
+    [
+        (
+            "curl_7.88.1-10+deb12u5",
+            Deb(name="curl", upstream_version="7.88.1", debian_revision="10+deb12u5"),
+        ),
+        (
+            "ncurses-base_6.4-4",
+            Deb(name="ncurses-base", upstream_version="6.4", debian_revision="4"),
+        ),
+        (
+            "python3.11_3.11.2-6+deb12u2",
+            Deb(
+                name="python3.11",
+                upstream_version="3.11.2",
+                debian_revision="6+deb12u2",
+            ),
+        ),
+        (
+            "libc6_2.36-9+deb12u7",
+            Deb(name="libc6", upstream_version="2.36", debian_revision="9+deb12u7"),
+        ),
+        (
+            "tzdata_2024a-0+deb12u1",
+            Deb(name="tzdata", upstream_version="2024a", debian_revision="0+deb12u1"),
+        ),
+        ("debianutils_5.7", Deb(name="debianutils", upstream_version="5.7")),
+        (
+            "bsdutils_1:2.38.1-5+deb12u1",
+            Deb(
+                name="bsdutils",
+                epoch=1,
+                upstream_version="2.38.1",
+                debian_revision="5+deb12u1",
+            ),
+        ),
+        (
+            "openssh-client_1:9.2p1-2+deb12u3",
+            Deb(
+                name="openssh-client",
+                epoch=1,
+                upstream_version="9.2p1",
+                debian_revision="2+deb12u3",
+            ),
+        ),
+        (
+            "grub-pc_2.06-13+deb12u1~bpo11+1",
+            Deb(
+                name="grub-pc",
+                upstream_version="2.06",
+                debian_revision="13+deb12u1~bpo11+1",
+            ),
+        ),
+        (
+            "example_1:2.0-rc1:final-1",
+            Deb(
+                name="example",
+                epoch=1,
+                upstream_version="2.0-rc1:final",
+                debian_revision="1",
+            ),
+        ),
+    ],
+)
+def test_deb_successful_parse(deb: str, expected: Deb):
+    actual = Deb.from_string(deb)
+    assert actual == expected
+    assert str(actual) == deb
+
+
+@pytest.mark.parametrize(
+    "deb",
+    [
+        "curl",
+        "_7.88.1-10",
+        "curl_",
+        "curl_-10",
+        "curl_7.88.1-",
+        "curl_:7.88.1-10",
+        "curl_x:7.88.1-10",
+        f"curl_{'1' * 11}:7.88.1-10",
+        "curl_7.88.1-10+deb12u5_amd64",
+        "curl_7.88.1-10+deb12u5_amd64.deb",
+        "curl_7.88.1_amd64",
+        "curl_7.88 1-10",
+        "curl_7.88.1-10:1",
+    ],
+)
+def test_deb_unsuccessful_parse(deb: str):
+    with pytest.raises(MalformedCoordinates):
+        Deb.from_string(deb)
+
+
+@pytest.mark.parametrize(
+    "limits,reason",
+    [
+        (ParseLimits(name=3), "name longer than 3"),
+        (ParseLimits(version=3), "upstream_version longer than 3"),
+        (ParseLimits(release=1), "debian_revision longer than 1"),
+    ],
+)
+def test_deb_limits(limits: ParseLimits, reason: str):
+    with pytest.raises(MalformedCoordinates, match=reason):
+        Deb.from_string("curl_7.88.1-10", limits=limits)
+
+
+def test_deb_from_version():
+    assert Deb.from_version("bsdutils", "1:2.38.1-5+deb12u1") == Deb.from_string(
+        "bsdutils_1:2.38.1-5+deb12u1"
+    )
+
+
+def test_deb_from_string_or_none():
+    assert Deb.from_string_or_none(None) is None
+    assert Deb.from_string_or_none("debianutils_5.7") == Deb(
+        name="debianutils", upstream_version="5.7"
+    )
+
+
+def test_deb_version():
+    assert Deb.from_string("bsdutils_1:2.38.1-5").version == "1:2.38.1-5"
+    assert Deb.from_string("debianutils_5.7").version == "5.7"
+
+
+def test_deb_unpacking_behavior():
+    n, e, u, r = Deb.from_string("curl_1:7.88.1-10+deb12u5")
+    assert n == "curl"
+    assert e == 1
+    assert u == "7.88.1"
+    assert r == "10+deb12u5"
+
+
+def test_deb_to_dict():
+    assert Deb.from_string("curl_1:7.88.1-10+deb12u5").to_dict() == {
+        "name": "curl",
+        "epoch": 1,
+        "upstream_version": "7.88.1",
+        "debian_revision": "10+deb12u5",
+    }
+
+
+def test_deb_version_key_is_cached(monkeypatch: pytest.MonkeyPatch):
+    calls: list[str] = []
+    original = pkgps.deb._dpkg_key
+
+    def spy(fragment: str) -> tuple[int, ...]:
+        calls.append(fragment)
+        return original(fragment)
+
+    monkeypatch.setattr(pkgps.deb, "_dpkg_key", spy)
+    debs = [Deb.from_string(f"curl_7.{i}-1") for i in range(10)]
+    sorted(debs)
+    sorted(debs, reverse=True)
+    assert debs[0].version_key == debs[0].version_key
+    # each instance tokenizes its upstream version and revision exactly once
+    assert len(calls) == 20
+
+    deb = Deb.from_string("curl_7.88.1-10+deb12u5")
+    assert deb.version_key
+    # the cached key is not part of equality, hashing, the repr, or the dict
+    assert deb == Deb.from_string("curl_7.88.1-10+deb12u5")
+    assert hash(deb) == hash(Deb.from_string("curl_7.88.1-10+deb12u5"))
+    assert "key" not in repr(deb)
+    assert set(deb.to_dict()) == {
+        "name",
+        "epoch",
+        "upstream_version",
+        "debian_revision",
+    }
+
+
+def test_deb_sorting():
+    expected = [
+        "a_1.0~~",
+        "a_1.0~~a",
+        "a_1.0~",
+        "a_1.0~rc1",
+        "a_1.0",
+        "a_1.0-1",
+        "a_1.0-1+b1",
+        "a_1.0-1.1",
+        "a_1.0a",
+        "a_1.0+dfsg",
+        "a_1.0.1",
+        "a_1.2",
+        "a_1.10",
+        "a_1:0.1",
+        "b_0.1",
+    ]
+    shuffled = expected[::2] + expected[1::2]
+    assert [str(d) for d in sorted(Deb.from_string(s) for s in shuffled)] == expected
+
+
+def test_deb_comparison_operators():
+    older = Deb.from_string("curl_7.88.1-10")
+    newer = Deb.from_string("curl_7.88.1-10+deb12u5")
+    assert older < newer
+    assert older <= newer
+    assert newer > older
+    assert newer >= older
+    assert not older > newer
+    # dpkg ignores leading zeros
+    assert Deb.from_string("a_1.01") <= Deb.from_string("a_1.1")
+    assert Deb.from_string("a_1.01") >= Deb.from_string("a_1.1")
+
+
+def test_deb_comparison_with_other_types():
+    with pytest.raises(TypeError):
+        _ = Deb.from_string("curl_7.88.1-10") < "curl_7.88.1-10"
+
+
+def _order(c: str) -> int:
+    if c.isdigit():
+        return 0
+    if c.isalpha():
+        return ord(c)
+    if c == "~":
+        return -1
+    return ord(c) + 256
+
+
+def _verrevcmp(a: str, b: str) -> int:
+    # A direct port of dpkg's verrevcmp from lib/dpkg/version.c
+    a, b = a + "\0", b + "\0"
+    i = j = 0
+    while a[i] != "\0" or b[j] != "\0":
+        first_diff = 0
+        while (a[i] != "\0" and not a[i].isdigit()) or (
+            b[j] != "\0" and not b[j].isdigit()
+        ):
+            ac = 0 if a[i] == "\0" else _order(a[i])
+            bc = 0 if b[j] == "\0" else _order(b[j])
+            if ac != bc:
+                return ac - bc
+            i += 1
+            j += 1
+        while a[i] == "0":
+            i += 1
+        while b[j] == "0":
+            j += 1
+        while a[i].isdigit() and b[j].isdigit():
+            if not first_diff:
+                first_diff = ord(a[i]) - ord(b[j])
+            i += 1
+            j += 1
+        if a[i].isdigit():
+            return 1
+        if b[j].isdigit():
+            return -1
+        if first_diff:
+            return first_diff
+    return 0
+
+
+def _sign(value: int) -> int:
+    return (value > 0) - (value < 0)
+
+
+def test_deb_version_key_matches_dpkg():
+    alphabet = ("0", "1", "a", "~", ".", "+")
+    fragments = [
+        "".join(chars)
+        for length in range(4)
+        for chars in product(alphabet, repeat=length)
+    ]
+    keys = {
+        f: Deb(name="a", upstream_version="1", debian_revision=f).version_key
+        for f in fragments
+    }
+    for a, b in product(fragments, repeat=2):
+        expected = _sign(_verrevcmp(a, b))
+        actual = (keys[a] > keys[b]) - (keys[a] < keys[b])
+        assert actual == expected, (a, b)
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from itertools import product
+
+import pytest
+
+from pkgps import NEVR, NEVRA, NVR
+from pkgps.evr import evr_key, rpmvercmp
+
+
+@pytest.mark.parametrize(
+    "a,b,expected",
+    [
+        # cases from RPM's own test suite (tests/rpmvercmp.at)
+        ("1.0", "1.0", 0),
+        ("1.0", "2.0", -1),
+        ("2.0.1", "2.0.1", 0),
+        ("2.0", "2.0.1", -1),
+        ("2.0.1a", "2.0.1a", 0),
+        ("2.0.1a", "2.0.1", 1),
+        ("5.5p1", "5.5p1", 0),
+        ("5.5p1", "5.5p2", -1),
+        ("5.5p10", "5.5p1", 1),
+        ("10xyz", "10.1xyz", -1),
+        ("xyz10", "xyz10.1", -1),
+        ("xyz.4", "8", -1),
+        ("xyz.4", "2", -1),
+        ("5.5p2", "5.6p1", -1),
+        ("5.6p1", "6.5p1", -1),
+        ("6.0.rc1", "6.0", 1),
+        ("10b2", "10a1", 1),
+        ("1.0aa", "1.0a", 1),
+        ("10.0001", "10.1", 0),
+        ("10.0001", "10.0039", -1),
+        ("4.999.9", "5.0", -1),
+        ("20101121", "20101122", -1),
+        ("2_0", "2_0", 0),
+        ("2.0", "2_0", 0),
+        ("a", "a", 0),
+        ("a+", "a_", 0),
+        ("+", "_", 0),
+        ("1.0~rc1", "1.0", -1),
+        ("1.0~rc1", "1.0~rc2", -1),
+        ("1.0~rc1~git123", "1.0~rc1", -1),
+        ("1.0^", "1.0", 1),
+        ("1.0^git1", "1.0", 1),
+        ("1.0^git1", "1.01", -1),
+        ("1.0^20160101", "1.0.1", -1),
+        ("1.0^20160101^git1", "1.0^20160101", 1),
+        ("1.0~rc1^git1", "1.0~rc1", 1),
+        ("1.0^git1~pre", "1.0^git1", -1),
+    ],
+)
+def test_rpmvercmp(a: str, b: str, expected: int):
+    assert rpmvercmp(a, b) == expected
+    assert rpmvercmp(b, a) == -expected
+
+
+def _reference_rpmvercmp(a: str, b: str) -> int:
+    # A direct port of rpmvercmp from rpmio/rpmvercmp.c
+    if a == b:
+        return 0
+    a, b = a + "\0", b + "\0"
+    i = j = 0
+
+    def isalnum(c: str) -> bool:
+        return c.isascii() and c.isalnum()
+
+    while a[i] != "\0" or b[j] != "\0":
+        while a[i] != "\0" and not isalnum(a[i]) and a[i] not in "~^":
+            i += 1
+        while b[j] != "\0" and not isalnum(b[j]) and b[j] not in "~^":
+            j += 1
+        if a[i] == "~" or b[j] == "~":
+            if a[i] != "~":
+                return 1
+            if b[j] != "~":
+                return -1
+            i += 1
+            j += 1
+            continue
+        if a[i] == "^" or b[j] == "^":
+            if a[i] == "\0":
+                return -1
+            if b[j] == "\0":
+                return 1
+            if a[i] != "^":
+                return 1
+            if b[j] != "^":
+                return -1
+            i += 1
+            j += 1
+            continue
+        if a[i] == "\0" or b[j] == "\0":
+            break
+        start_i, start_j = i, j
+        isnum = a[i].isdigit()
+        kind = str.isdigit if isnum else str.isalpha
+        while a[i] != "\0" and a[i].isascii() and kind(a[i]):
+            i += 1
+        while b[j] != "\0" and b[j].isascii() and kind(b[j]):
+            j += 1
+        one, two = a[start_i:i], b[start_j:j]
+        if not two:
+            return 1 if isnum else -1
+        if isnum:
+            one, two = one.lstrip("0"), two.lstrip("0")
+            if len(one) != len(two):
+                return 1 if len(one) > len(two) else -1
+        if one != two:
+            return 1 if one > two else -1
+    if a[i] == "\0" and b[j] == "\0":
+        return 0
+    return 1 if a[i] != "\0" else -1
+
+
+def test_rpmvercmp_matches_rpm():
+    alphabet = ("0", "1", "a", "b", "~", "^", ".")
+    versions = [
+        "".join(chars)
+        for length in range(4)
+        for chars in product(alphabet, repeat=length)
+    ]
+    for a, b in product(versions, repeat=2):
+        assert rpmvercmp(a, b) == _reference_rpmvercmp(a, b), (a, b)
+
+
+def test_evr_key_orders_by_epoch_version_release():
+    candidates = [
+        NEVRA.from_string("curl-1:7.76.1-26.el9.x86_64"),
+        NEVRA.from_string("curl-7.76.1-29.el9.x86_64"),
+        NEVRA.from_string("curl-1:7.76.1-29.el9.x86_64"),
+        NEVRA.from_string("curl-1:7.76.1-26.el9_3.x86_64"),
+        NEVRA.from_string("curl-1:7.9-1.el9.x86_64"),
+    ]
+    assert [str(c) for c in sorted(candidates, key=evr_key)] == [
+        "curl-7.76.1-29.el9.x86_64",
+        "curl-1:7.9-1.el9.x86_64",
+        "curl-1:7.76.1-26.el9.x86_64",
+        "curl-1:7.76.1-26.el9_3.x86_64",
+        "curl-1:7.76.1-29.el9.x86_64",
+    ]
+
+
+def test_evr_key_without_epoch():
+    assert evr_key(NVR.from_string("curl-8.6.0-7.fc40")) == evr_key(
+        NEVR.from_string("curl-0:8.6.0-7.fc40")
+    )
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import pytest
+
+from pkgps import NEVRA, NVRA, BloomFilter
+
+MEMBERS = [
+    NEVRA.from_string(f"pkg{i}-{i % 3}:1.{i}-{i % 7}.el9.x86_64") for i in range(2000)
+]
+NON_MEMBERS = [
+    NEVRA.from_string(f"other{i}-1:2.{i}-1.el9.aarch64") for i in range(20_000)
+]
+
+
+def test_members_are_always_found():
+    bloom = BloomFilter.from_coordinates(MEMBERS)
+    assert all(c in bloom for c in MEMBERS)
+    assert all(bloom.contains_many(MEMBERS))
+    assert len(bloom) == len(MEMBERS)
+
+
+@pytest.mark.parametrize("fp_rate", [0.1, 0.01, 0.001])
+def test_false_positive_rate(fp_rate: float):
+    bloom = BloomFilter.from_coordinates(MEMBERS, fp_rate=fp_rate)
+    false_positives = sum(bloom.contains_many(NON_MEMBERS))
+    # the hash is stable so this is deterministic, the bound allows for variance
+    assert false_positives / len(NON_MEMBERS) < fp_rate * 2
+    assert bloom.false_positive_rate == pytest.approx(fp_rate, rel=0.25)
+
+
+def test_contains_many_matches_contains():
+    bloom = BloomFilter.from_coordinates(MEMBERS, fp_rate=0.2)
+    candidates = MEMBERS[:100] + NON_MEMBERS[:1000]
+    assert bloom.contains_many(candidates) == [c in bloom for c in candidates]
+
+
+def test_membership_uses_string_form():
+    bloom = BloomFilter(capacity=10)
+    bloom.add(NEVRA.from_string("curl-0:8.6.0-7.fc40.x86_64"))
+    assert "curl-8.6.0-7.fc40.x86_64" in bloom
+    assert NVRA.from_string("curl-8.6.0-7.fc40.x86_64") in bloom
+
+
+def test_size_scales_with_fp_rate():
+    loose = BloomFilter(capacity=100_000, fp_rate=0.01)
+    tight = BloomFilter(capacity=100_000, fp_rate=0.0001)
+    assert loose.num_bits / 100_000 < 10
+    assert tight.num_bits > loose.num_bits
+    assert tight.num_hashes > loose.num_hashes
+
+
+def test_round_trip_bytes():
+    bloom = BloomFilter.from_coordinates(MEMBERS, fp_rate=0.01)
+    data = bloom.to_bytes()
+    assert len(data) < len(MEMBERS) * 2
+    restored = BloomFilter.from_bytes(data)
+    assert restored.num_bits == bloom.num_bits
+    assert restored.num_hashes == bloom.num_hashes
+    assert len(restored) == len(bloom)
+    candidates = MEMBERS + NON_MEMBERS[:2000]
+    assert restored.contains_many(candidates) == bloom.contains_many(candidates)
+    assert restored.to_bytes() == data
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"XXXX" + bytes(32),
+        BloomFilter(capacity=10).to_bytes()[:-1],
+        b"PKBF\x02" + BloomFilter(capacity=10).to_bytes()[5:],
+    ],
+)
+def test_from_bytes_rejects_invalid_data(data: bytes):
+    with pytest.raises(ValueError):
+        BloomFilter.from_bytes(data)
+
+
+def test_empty_filter():
+    bloom = BloomFilter.from_coordinates([])
+    assert MEMBERS[0] not in bloom
+    assert bloom.false_positive_rate == 0
+
+
+@pytest.mark.parametrize("capacity,fp_rate", [(-1, 0.01), (10, 0), (10, 1)])
+def test_invalid_parameters(capacity: int, fp_rate: float):
+    with pytest.raises(ValueError):
+        BloomFilter(capacity, fp_rate)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import os
+
+# Ignore: bandit B404
+# Reason: The tests only run the current interpreter with fixed arguments.
+import subprocess  # nosec B404
+import sys
+
+import pytest
+
+import pkgps
+
+
+def _run(code: str) -> str:
+    # Ignore: bandit B603
+    # Reason: The command is always `sys.executable -c` with code from these tests.
+    result = subprocess.run(  # nosec B603
+        [sys.executable, "-c", code],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)},
+    )
+    return result.stdout.strip()
+
+
+def test_import_does_not_load_submodules():
+    loaded = _run(
+        "import sys, pkgps; "
+        "print(sorted(m for m in ('attr', 'pkgps.nvr') if m in sys.modules))"
+    )
+    assert loaded == "[]"
+
+
+def test_lazy_attribute_loads_on_access():
+    loaded = _run("import sys, pkgps; pkgps.NEVRA; print('pkgps.nvr' in sys.modules)")
+    assert loaded == "True"
+
+
+def test_public_names_resolve():
+    from pkgps import nvr
+
+    for name in ("NEVR", "NEVRA", "NVR", "NVRA"):
+        assert getattr(pkgps, name) is getattr(nvr, name)
+    assert set(pkgps.__all__) <= set(dir(pkgps))
+
+
+def test_unknown_attribute_raises():
+    with pytest.raises(AttributeError, match="no_such_name"):
+        pkgps.no_such_name  # noqa: B018
+
+
+def test_pydantic_extension_defers_pydantic_import():
+    loaded = _run(
+        "import sys, pkgps.extensions.pydantic; print('pydantic' in sys.modules)"
+    )
+    assert loaded == "False"
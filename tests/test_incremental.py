@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pkgps import NEVRA, MalformedCoordinates
+from pkgps.incremental import CoordinateDelta, IncrementalParser
+
+CURL = "curl-1:7.76.1-26.el9.x86_64"
+CURL_UPDATED = "curl-1:7.76.1-29.el9.x86_64"
+BASH = "bash-5.1.8-9.el9.x86_64"
+
+
+def test_first_update_adds_everything():
+    parser = IncrementalParser(NEVRA)
+    delta = parser.update([CURL, BASH])
+    assert delta.added == {NEVRA.from_string(CURL), NEVRA.from_string(BASH)}
+    assert delta.removed == frozenset()
+
+
+def test_update_reports_changed_lines_only():
+    parser = IncrementalParser(NEVRA)
+    parser.update([CURL, BASH])
+    delta = parser.update([CURL_UPDATED, BASH])
+    assert delta == CoordinateDelta(
+        added=frozenset({NEVRA.from_string(CURL_UPDATED)}),
+        removed=frozenset({NEVRA.from_string(CURL)}),
+    )
+    assert set(parser.coordinates) == {
+        NEVRA.from_string(CURL_UPDATED),
+        NEVRA.from_string(BASH),
+    }
+
+
+def test_unchanged_lines_are_not_reparsed(monkeypatch: pytest.MonkeyPatch):
+    parser = IncrementalParser(NEVRA)
+    parser.update([CURL, BASH])
+
+    parsed: list[str] = []
+    original = NEVRA.from_string.__func__  # type: ignore[attr-defined]
+
+    def spy(cls, coordinate: str, **kwargs):
+        parsed.append(coordinate)
+        return original(cls, coordinate, **kwargs)
+
+    monkeypatch.setattr(NEVRA, "from_string", classmethod(spy))
+    parser.update([BASH, CURL_UPDATED])
+    assert parsed == [CURL_UPDATED]
+
+
+def test_blank_lines_and_whitespace_are_ignored():
+    parser = IncrementalParser(NEVRA)
+    parser.update([f"{CURL}\n", "\n", f"  {BASH}  "])
+    delta = parser.update([CURL, BASH])
+    assert not delta
+
+
+def test_respelled_coordinates_are_not_reported():
+    parser = IncrementalParser(NEVRA)
+    parser.update(["bash-0:5.1.8-9.el9.x86_64"])
+    assert not parser.update([BASH])
+
+
+def test_dropping_one_spelling_keeps_coordinates():
+    parser = IncrementalParser(NEVRA)
+    parser.update(["bash-0:5.1.8-9.el9.x86_64", BASH])
+    delta = parser.update([BASH])
+    assert not delta
+    assert list(parser.coordinates) == [NEVRA.from_string(BASH)]
+
+
+def test_coordinates_are_distinct():
+    parser = IncrementalParser(NEVRA)
+    parser.update([BASH, "bash-0:5.1.8-9.el9.x86_64"])
+    assert len(parser.coordinates) == 1
+    assert set(parser.coordinates) == {NEVRA.from_string(BASH)}
+
+
+def test_adding_another_spelling_adds_nothing():
+    parser = IncrementalParser(NEVRA)
+    parser.update([BASH])
+    assert not parser.update([BASH, "bash-0:5.1.8-9.el9.x86_64"])
+
+
+def test_failed_update_keeps_previous_state():
+    parser = IncrementalParser(NEVRA)
+    parser.update([CURL])
+    with pytest.raises(MalformedCoordinates):
+        parser.update([BASH, "kernel"])
+    assert list(parser.coordinates) == [NEVRA.from_string(CURL)]
+
+
+def test_update_file_short_circuits_unchanged_file(tmp_path: Path):
+    manifest = tmp_path / "host.txt"
+    manifest.write_text(f"{CURL}\n{BASH}\n")
+    parser = IncrementalParser(NEVRA)
+    assert parser.update_file(manifest).added == {
+        NEVRA.from_string(CURL),
+        NEVRA.from_string(BASH),
+    }
+    assert not parser.update_file(manifest)
+
+    manifest.write_text(f"{CURL_UPDATED}\n{BASH}\n")
+    delta = parser.update_file(manifest)
+    assert delta.added == {NEVRA.from_string(CURL_UPDATED)}
+    assert delta.removed == {NEVRA.from_string(CURL)}
+
+
+def test_reset_forgets_previous_parse():
+    parser = IncrementalParser(NEVRA)
+    parser.update([CURL])
+    parser.reset()
+    assert not parser.coordinates
+    assert parser.update([CURL]).added == {NEVRA.from_string(CURL)}
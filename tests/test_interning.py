@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pkgps import NEVR, NEVRA, NVR, NVRA, Interner
+from pkgps.interning import ComponentPool
+from pkgps.parallel import parse_many
+
+
+def _copy(value: str) -> str:
+    # build an equal string that is guaranteed not to be the same object
+    return "".join(list(value))
+
+
+def test_pool_returns_canonical_string():
+    pool = ComponentPool(maxsize=8)
+    first = _copy("x86_64")
+    second = _copy("x86_64")
+    assert second is not first
+    assert pool(first) is first
+    assert pool(second) is first
+    assert len(pool) == 1
+    assert "x86_64" in pool
+
+
+def test_pool_is_bounded():
+    pool = ComponentPool(maxsize=2)
+    pool("a")
+    pool("b")
+    overflow = _copy("cc")
+    assert pool(overflow) is overflow
+    assert len(pool) == 2
+    assert "cc" not in pool
+
+
+def test_pool_clear():
+    pool = ComponentPool(maxsize=2)
+    pool("a")
+    pool("b")
+    pool.clear()
+    assert len(pool) == 0
+    assert pool("c") == "c"
+    assert len(pool) == 1
+
+
+def test_pool_rejects_negative_maxsize():
+    with pytest.raises(ValueError):
+        ComponentPool(maxsize=-1)
+
+
+def test_pool_stays_bounded_across_threads():
+    pool = ComponentPool(maxsize=100)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        list(executor.map(pool, (str(i) for i in range(10_000))))
+    assert len(pool) == 100
+
+
+@pytest.mark.parametrize(
+    "type_,coordinate",
+    [
+        (NVR, "curl-8.6.0-7.fc40"),
+        (NEVR, "curl-1:8.6.0-7.fc40"),
+        (NVRA, "curl-8.6.0-7.fc40.x86_64"),
+        (NEVRA, "curl-1:8.6.0-7.fc40.x86_64"),
+    ],
+)
+def test_from_string_shares_components(type_: type[NVR], coordinate: str):
+    interner = Interner()
+    first = type_.from_string(_copy(coordinate), interner=interner)
+    second = type_.from_string(_copy(coordinate), interner=interner)
+    assert first == second == type_.from_string(coordinate)
+    for a, b in zip(first, second):
+        assert a is b
+
+
+def test_interner_clear():
+    interner = Interner()
+    NEVRA.from_string("curl-1:8.6.0-7.fc40.x86_64", interner=interner)
+    interner.clear()
+    assert not any(
+        len(pool)
+        for pool in (interner.name, interner.version, interner.release, interner.arch)
+    )
+
+
+def test_parse_many_with_interner():
+    interner = Interner()
+    coordinates = [f"pkg{i % 10}-1.0-1.fc40.x86_64" for i in range(1000)]
+    parsed = parse_many(
+        NVRA, coordinates, max_workers=4, chunksize=50, interner=interner
+    )
+    assert len({id(c.name) for c in parsed}) == 10
+    assert len({id(c.arch) for c in parsed}) == 1
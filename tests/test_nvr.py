@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import pytest
 
-from pkgps import NEVR, NEVRA, NVR, NVRA, MalformedCoordinates
+from pkgps import NEVR, NEVRA, NVR, NVRA, MalformedCoordinates, ParseLimits
 
 
 @pytest.mark.parametrize(
@@ -381,3 +381,56 @@ def test_from_string_or_none(
     assert actual == expected
     if expected is not None:
         assert isinstance(actual, receiver)
+
+
+@pytest.mark.parametrize(
+    "coordinate,type_",
+    [
+        ("dbus-x:1.14.10-3.fc40", NEVR),
+        ("dbus-+1:1.14.10-3.fc40", NEVR),
+        ("dbus-1_0:1.14.10-3.fc40", NEVR),
+        ("dbus-:1.14.10-3.fc40.aarch64", NEVRA),
+        ("dbus-\u0661:1.14.10-3.fc40.aarch64", NEVRA),
+        (f"dbus-{'9' * 11}:1.14.10-3.fc40.aarch64", NEVRA),
+    ],
+)
+def test_invalid_epoch(coordinate: str, type_: type[NVR]):
+    with pytest.raises(MalformedCoordinates, match="epoch"):
+        type_.from_string(coordinate)
+
+
+@pytest.mark.parametrize("type_", [NVR, NEVR, NVRA, NEVRA])
+def test_default_limits_reject_oversized_input(type_: type[NVR]):
+    coordinate = f"{'a' * 2000}-1.0-1.fc40.x86_64"
+    with pytest.raises(MalformedCoordinates, match="longer than 1024") as exc_info:
+        type_.from_string(coordinate)
+    # the offending input is truncated in the error message
+    assert len(str(exc_info.value)) < 300
+
+
+@pytest.mark.parametrize(
+    "coordinate,limits,component",
+    [
+        ("dbus-1:1.14.10-3.fc40.aarch64", ParseLimits(name=3), "name"),
+        ("dbus-1:1.14.10-3.fc40.aarch64", ParseLimits(version=6), "version"),
+        ("dbus-1:1.14.10-3.fc40.aarch64", ParseLimits(release=5), "release"),
+        ("dbus-1:1.14.10-3.fc40.aarch64", ParseLimits(arch=6), "arch"),
+        ("dbus-10:1.14.10-3.fc40.aarch64", ParseLimits(epoch=1), "epoch"),
+        ("dbus-1:1.14.10-3.fc40.aarch64", ParseLimits(length=20), "longer than 20"),
+    ],
+)
+def test_custom_limits(coordinate: str, limits: ParseLimits, component: str):
+    with pytest.raises(MalformedCoordinates, match=component):
+        NEVRA.from_string(coordinate, limits=limits)
+
+
+def test_limits_are_inclusive():
+    limits = ParseLimits(length=29, name=4, epoch=1, version=7, release=6, arch=7)
+    assert NEVRA.from_string("dbus-1:1.14.10-3.fc40.aarch64", limits=limits) == NEVRA(
+        name="dbus", epoch=1, version="1.14.10", release="3.fc40", arch="aarch64"
+    )
+
+
+def test_from_string_or_none_passes_limits():
+    with pytest.raises(MalformedCoordinates):
+        NVR.from_string_or_none("dbus-1.14.10-3.fc40", limits=ParseLimits(name=1))
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pkgps import NEVRA, NVR, MalformedCoordinates
+from pkgps.parallel import parse_many
+
+COORDINATES = [f"pkg{i}-1:1.{i}-{i % 7}.fc40.x86_64" for i in range(1000)]
+
+
+@pytest.mark.parametrize("max_workers", [1, 4])
+def test_parse_many_preserves_order(max_workers: int):
+    actual = parse_many(NEVRA, COORDINATES, max_workers=max_workers, chunksize=64)
+    assert actual == [NEVRA.from_string(c) for c in COORDINATES]
+
+
+def test_parse_many_accepts_iterators():
+    actual = parse_many(NVR, iter(["curl-8.6.0-7.fc40", "bash-5.2.26-3.fc40"]))
+    assert actual == [
+        NVR(name="curl", version="8.6.0", release="7.fc40"),
+        NVR(name="bash", version="5.2.26", release="3.fc40"),
+    ]
+
+
+def test_parse_many_empty_input():
+    assert parse_many(NEVRA, []) == []
+
+
+def test_parse_many_uses_given_executor():
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        actual = parse_many(NEVRA, COORDINATES, chunksize=100, executor=executor)
+        # the executor is still usable afterwards
+        assert executor.submit(len, COORDINATES).result() == len(COORDINATES)
+    assert len(actual) == len(COORDINATES)
+
+
+def test_parse_many_raises_first_malformed_coordinate():
+    coordinates = [*COORDINATES[:300], "kernel", *COORDINATES[300:], "bash"]
+    with pytest.raises(MalformedCoordinates, match="kernel"):
+        parse_many(NEVRA, coordinates, max_workers=4, chunksize=16)
+
+
+def test_parse_many_rejects_bad_chunksize():
+    with pytest.raises(ValueError):
+        parse_many(NEVRA, COORDINATES, chunksize=0)
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import bz2
+import gzip
+import io
+import lzma
+from collections.abc import Callable
+from pathlib import Path
+
+# Ignore: bandit B405
+# Reason: Only the exception type is imported, to assert on malformed XML. Nothing
+#   here parses untrusted XML.
+from xml.etree.ElementTree import ParseError  # nosec B405
+
+import pytest
+
+from pkgps import NEVRA, MalformedCoordinates, ParseLimits
+from pkgps.repodata import iter_primary
+
+PACKAGE = """\
+<package type="rpm">
+  <name>{name}</name>
+  <arch>{arch}</arch>
+  <version epoch="{epoch}" ver="{ver}" rel="{rel}"/>
+  <checksum type="sha256" pkgid="YES">0123456789abcdef</checksum>
+  <summary>A package</summary>
+  <format>
+    <rpm:license>MIT</rpm:license>
+    <rpm:provides>
+      <rpm:entry name="{name}" flags="EQ" epoch="{epoch}" ver="{ver}" rel="{rel}"/>
+    </rpm:provides>
+  </format>
+</package>
+"""
+
+
+def primary(*packages: str) -> bytes:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<metadata xmlns="http://linux.duke.edu/metadata/common" '
+        'xmlns:rpm="http://linux.duke.edu/metadata/rpm" '
+        f'packages="{len(packages)}">\n' + "".join(packages) + "</metadata>\n"
+    ).encode()
+
+
+PRIMARY = primary(
+    PACKAGE.format(name="curl", arch="x86_64", epoch="0", ver="8.6.0", rel="7.fc40"),
+    PACKAGE.format(name="dbus", arch="aarch64", epoch="1", ver="1.14.10", rel="3.fc40"),
+    PACKAGE.format(name="emacs", arch="src", epoch="1", ver="29.2", rel="3.fc40"),
+)
+
+EXPECTED = [
+    NEVRA(name="curl", epoch=0, version="8.6.0", release="7.fc40", arch="x86_64"),
+    NEVRA(name="dbus", epoch=1, version="1.14.10", release="3.fc40", arch="aarch64"),
+    NEVRA(name="emacs", epoch=1, version="29.2", release="3.fc40", arch="src"),
+]
+
+
+def _zstd_compress(data: bytes) -> bytes:
+    zstandard = pytest.importorskip("zstandard")
+    return zstandard.ZstdCompressor().compress(data)
+
+
+@pytest.mark.parametrize(
+    "filename,compress",
+    [
+        ("primary.xml", lambda data: data),
+        ("primary.xml.gz", gzip.compress),
+        ("primary.xml.xz", lzma.compress),
+        ("primary.xml.bz2", bz2.compress),
+        ("primary.xml.zst", _zstd_compress),
+    ],
+)
+def test_iter_primary_from_path(
+    tmp_path: Path, filename: str, compress: Callable[[bytes], bytes]
+):
+    path = tmp_path / filename
+    path.write_bytes(compress(PRIMARY))
+    assert list(iter_primary(path)) == EXPECTED
+    assert list(iter_primary(str(path))) == EXPECTED
+
+
+def test_iter_primary_from_file_object():
+    assert list(iter_primary(io.BytesIO(PRIMARY))) == EXPECTED
+
+
+def test_iter_primary_missing_epoch_defaults_to_zero():
+    package = (
+        '<package><name>a</name><arch>noarch</arch><version ver="1" rel="1"/></package>'
+    )
+    assert list(iter_primary(io.BytesIO(primary(package)))) == [
+        NEVRA(name="a", version="1", release="1", arch="noarch")
+    ]
+
+
+@pytest.mark.parametrize(
+    "content",
+    [
+        '<arch>noarch</arch><version ver="1" rel="1"/>',
+        '<name>a</name><version ver="1" rel="1"/>',
+        "<name>a</name><arch>noarch</arch>",
+        '<name>a</name><arch>noarch</arch><version ver="1"/>',
+        '<name>a</name><arch>noarch</arch><version epoch="x" ver="1" rel="1"/>',
+        f'<name>a</name><arch>x</arch><version epoch="{"9" * 99}" ver="1" rel="1"/>',
+    ],
+)
+def test_iter_primary_malformed_package(content: str):
+    with pytest.raises(MalformedCoordinates):
+        list(iter_primary(io.BytesIO(primary(f"<package>{content}</package>"))))
+
+
+@pytest.mark.parametrize(
+    "content,limits,reason",
+    [
+        (f"<name>{'a' * 300}</name><arch>x</arch>", ParseLimits(), "name longer"),
+        ("<name>a</name><arch>x</arch>", ParseLimits(version=0), "version longer"),
+        ("<name>a</name><arch>x</arch>", ParseLimits(release=0), "release longer"),
+        ("<name>a</name><arch>noarch</arch>", ParseLimits(arch=4), "arch longer"),
+        ("<name>a</name><arch>x</arch>", ParseLimits(epoch=1), "epoch must be"),
+    ],
+)
+def test_iter_primary_enforces_limits(content: str, limits: ParseLimits, reason: str):
+    package = f'<package>{content}<version epoch="10" ver="1" rel="1"/></package>'
+    with pytest.raises(MalformedCoordinates, match=reason):
+        list(iter_primary(io.BytesIO(primary(package)), limits=limits))
+
+
+def test_iter_primary_is_lazy():
+    # the second package is never parsed, so the broken XML after it isn't noticed
+    packages = iter_primary(io.BytesIO(PRIMARY[: PRIMARY.rindex(b"<package")]))
+    assert next(packages) == EXPECTED[0]
+
+
+def test_iter_primary_invalid_xml():
+    with pytest.raises(ParseError):
+        list(iter_primary(io.BytesIO(b"<metadata><package>")))